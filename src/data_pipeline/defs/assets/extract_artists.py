@@ -22,6 +22,7 @@ from data_pipeline.utils.network_helpers import (
 from data_pipeline.utils.wikidata_helpers import (
     async_fetch_wikidata_entities_batch,
     async_resolve_qids_to_labels,
+    clear_label_cache,
     extract_wikidata_aliases,
     extract_wikidata_claim_value,
     extract_wikidata_claim_ids,
@@ -281,6 +282,8 @@ async def extract_artists(
         A list of enriched Artist objects.
     """
     context.log.info("Starting artist enrichment for full index.")
+    # Labels resolved by an earlier run in this process may be stale
+    clear_label_cache()
 
     all_enriched_artists = []
     
@@ -15,6 +15,7 @@ from dagster import asset, AssetExecutionContext
 
 from data_pipeline.models import Article, ArticleMetadata
 from data_pipeline.settings import settings
+from data_pipeline.utils.io_helpers import migrate_flat_cache_to_shards
 from data_pipeline.utils.network_helpers import yield_batches_concurrently, AsyncClient
 from data_pipeline.utils.data_transformation_helpers import (
     normalize_and_clean_text,
@@ -69,10 +70,19 @@ async def extract_artist_articles(
     """
     context.log.info("Loading validated artists, genres, and artist index from inputs.")
 
-    # 1. Prepare Mappings
-    genres_df = genres.collect()
-    artist_index_df = artist_index.collect()
-    artists_df = artists.collect().unique(subset=["id"], keep="first", maintain_order=True)
+    # Move articles cached before sharding into place once, before any lookups
+    migrated = await asyncio.to_thread(
+        migrate_flat_cache_to_shards, settings.WIKIPEDIA_CACHE_DIRPATH, ".txt"
+    )
+    if migrated:
+        context.log.info(f"Moved {migrated} cached articles into the sharded cache layout.")
+
+    # 1. Prepare Mappings (deduplicate inside the lazy plan, collect with the streaming engine)
+    genres_df = genres.select("id", "name").collect(engine="streaming")
+    artist_index_df = artist_index.select("artist_uri", "start_date").collect(engine="streaming")
+    artists_df = artists.unique(subset=["id"], keep="first", maintain_order=True).collect(
+        engine="streaming"
+    )
 
     genres_map: dict[str, str] = {
         str(k): str(v) 
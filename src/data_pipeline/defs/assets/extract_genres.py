@@ -15,7 +15,7 @@ from dagster import asset, AssetExecutionContext
 
 from data_pipeline.models import Genre
 from data_pipeline.settings import settings
-from data_pipeline.utils.network_helpers import AsyncClient
+from data_pipeline.utils.network_helpers import AsyncClient, yield_batches_in_order
 from data_pipeline.utils.data_transformation_helpers import normalize_and_clean_text
 from data_pipeline.utils.wikidata_helpers import (
     async_fetch_wikidata_entities_batch,
@@ -117,16 +117,25 @@ async def extract_genres(
         return batch_results
 
     # 3. Processing
+    # Batches are fetched concurrently but consumed in input order as they complete
     batch_size = settings.WIKIDATA_ACTION_BATCH_SIZE
     total_genres = len(unique_genre_ids)
     all_genres = []
-    
+
     async with wikidata.get_client(context) as client:
-        for i in range(0, total_genres, batch_size):
-            chunk = unique_genre_ids[i: i + batch_size]
-            context.log.info(f"Processing genre batch {i}/{total_genres}")
-            
-            batch_data = await process_batch(chunk, client)
+        genre_stream = yield_batches_in_order(
+            items=unique_genre_ids,
+            batch_size=batch_size,
+            processor_fn=process_batch,
+            concurrency_limit=settings.WIKIDATA_CONCURRENT_REQUESTS,
+            description="Processing Genres",
+            client=client,
+        )
+
+        offset = 0
+        async for batch_data in genre_stream:
+            context.log.info(f"Processed genre batch {offset}/{total_genres}")
             all_genres.extend(batch_data)
-        
+            offset += batch_size
+
     return pl.DataFrame(all_genres).lazy()
@@ -15,6 +15,7 @@ from dagster import asset, AssetExecutionContext
 
 from data_pipeline.models import Article, ArticleMetadata
 from data_pipeline.settings import settings
+from data_pipeline.utils.io_helpers import migrate_flat_cache_to_shards
 from data_pipeline.utils.network_helpers import yield_batches_concurrently, AsyncClient
 from data_pipeline.utils.data_transformation_helpers import (
     normalize_and_clean_text,
@@ -24,6 +25,7 @@ from data_pipeline.utils.data_transformation_helpers import (
 from data_pipeline.utils.wikidata_helpers import (
     async_fetch_wikidata_entities_batch,
     async_resolve_qids_to_labels,
+    clear_label_cache,
     extract_wikidata_wikipedia_url,
     extract_wikidata_claim_value,
 )
@@ -91,9 +93,20 @@ async def extract_genres_articles(
         A list of batches (lists of Article objects).
     """
     context.log.info("Loading genres from input.")
+    # Labels resolved by an earlier run in this process may be stale
+    clear_label_cache()
 
-    # 1. Prepare Data
-    genres_df = genres.collect().unique(subset=["id"], keep="first", maintain_order=True)
+    # Move articles cached before sharding into place once, before any lookups
+    migrated = await asyncio.to_thread(
+        migrate_flat_cache_to_shards, settings.WIKIPEDIA_CACHE_DIRPATH, ".txt"
+    )
+    if migrated:
+        context.log.info(f"Moved {migrated} cached articles into the sharded cache layout.")
+
+    # 1. Prepare Data (deduplicate inside the lazy plan, collect with the streaming engine)
+    genres_df = genres.unique(subset=["id"], keep="first", maintain_order=True).collect(
+        engine="streaming"
+    )
     rows_to_process = genres_df.to_dicts()
     total_rows = len(rows_to_process)
     context.log.info(f"Found {total_rows} genres to process for Wikipedia articles.")
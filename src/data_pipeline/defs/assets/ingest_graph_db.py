@@ -16,6 +16,7 @@ from data_pipeline.settings import settings
 from data_pipeline.utils.neo4j_helpers import (
     clear_database,
     execute_cypher,
+    execute_cypher_batch,
 )
 from data_pipeline.defs.resources import Neo4jResource
 
@@ -46,13 +47,14 @@ def _create_indexes(driver: Driver, context: AssetExecutionContext) -> None:
         "CREATE FULLTEXT INDEX country_fulltext_idx IF NOT EXISTS FOR (n:Country) ON EACH [n.name, n.aliases]",
     ]
 
-    for cmd in index_commands:
-        try:
-            execute_cypher(driver, cmd, transactional=False)
-            context.log.info(f"Executed: {cmd}")
-        except Exception as e:
-            context.log.error(f"Failed to execute '{cmd}': {e}")
-            raise e
+    with driver.session(database="neo4j") as session:
+        for cmd in index_commands:
+            try:
+                execute_cypher(driver, cmd, transactional=False, session=session)
+                context.log.info(f"Executed: {cmd}")
+            except Exception as e:
+                context.log.error(f"Failed to execute '{cmd}': {e}")
+                raise e
 
 
 @asset(
@@ -124,7 +126,7 @@ def ingest_graph_db(
         # 0. Countries
         # noinspection SqlNoDataSourceInspection
         country_query = """
-        UNWIND $batch AS row
+        UNWIND $rows AS row
         CREATE (:Country {
             id: row.id, 
             name: row.name,
@@ -133,19 +135,16 @@ def ingest_graph_db(
         """
         # Materialize only Countries for processing
         countries_df = countries.collect()
-        country_count = 0
-        if not countries_df.is_empty():
-            for batch_df in countries_df.iter_slices(n_rows=batch_size):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, country_query, {"batch": batch_data})
-                country_count += len(batch_data)
+        country_count = execute_cypher_batch(
+            driver, country_query, countries_df.iter_rows(named=True), chunk_size=batch_size
+        )
         context.log.info(f"Loaded {country_count} countries.")
         del countries_df  # Free memory
 
         # 1. Genres
         # noinspection SqlNoDataSourceInspection
         genre_query = """
-        UNWIND $batch AS row
+        UNWIND $rows AS row
         CREATE (:Genre {
             id: row.id, 
             name: row.name, 
@@ -154,19 +153,16 @@ def ingest_graph_db(
         """
         # Materialize only Genres
         genres_df = genres.collect()
-        genre_count = 0
-        if not genres_df.is_empty():
-            for batch_df in genres_df.iter_slices(n_rows=batch_size):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, genre_query, {"batch": batch_data})
-                genre_count += len(batch_data)
+        genre_count = execute_cypher_batch(
+            driver, genre_query, genres_df.iter_rows(named=True), chunk_size=batch_size
+        )
         context.log.info(f"Loaded {genre_count} genres.")
         del genres_df  # Free memory
 
         # 2. Artists
         # noinspection SqlNoDataSourceInspection
         artist_query = """
-        UNWIND $batch AS row
+        UNWIND $rows AS row
         CREATE (:Artist {
             id: row.id, 
             name: row.name,
@@ -176,19 +172,16 @@ def ingest_graph_db(
         """
         # Materialize only Artists
         artists_df = artists.collect()
-        artist_count = 0
-        if not artists_df.is_empty():
-            for batch_df in artists_df.iter_slices(n_rows=batch_size):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, artist_query, {"batch": batch_data})
-                artist_count += len(batch_data)
+        artist_count = execute_cypher_batch(
+            driver, artist_query, artists_df.iter_rows(named=True), chunk_size=batch_size
+        )
         context.log.info(f"Loaded {artist_count} artists.")
         del artists_df  # Free memory
 
         # 3. Releases (with embedded tracks)
         # noinspection SqlNoDataSourceInspection
         release_query = """
-        UNWIND $batch AS row
+        UNWIND $rows AS row
         CREATE (:Release {
             id: row.id,
             title: row.title,
@@ -198,12 +191,9 @@ def ingest_graph_db(
         """
         # Materialize only Enriched Releases
         releases_df = releases_enriched_lazy.collect()
-        release_count = 0
-        if not releases_df.is_empty():
-            for batch_df in releases_df.iter_slices(n_rows=batch_size):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, release_query, {"batch": batch_data})
-                release_count += len(batch_data)
+        release_count = execute_cypher_batch(
+            driver, release_query, releases_df.iter_rows(named=True), chunk_size=batch_size
+        )
         context.log.info(f"Loaded {release_count} releases.")
         del releases_df  # Free memory
 
@@ -218,15 +208,13 @@ def ingest_graph_db(
         ag_df = artists.select("id", "genres").filter(pl.col("genres").is_not_null()).collect()
         if not ag_df.is_empty():
             ag_query = """
-            UNWIND $batch AS row
+            UNWIND $rows AS row
             MATCH (a:Artist {id: row.id})
             UNWIND row.genres AS gid
             MATCH (g:Genre {id: gid})
             MERGE (a)-[:PLAYS_GENRE]->(g)
             """
-            for batch_df in ag_df.iter_slices(n_rows=1000):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, ag_query, {"batch": batch_data})
+            execute_cypher_batch(driver, ag_query, ag_df.iter_rows(named=True))
         context.log.info("Ingested Artist -> Genre relationships.")
         del ag_df
 
@@ -234,7 +222,7 @@ def ingest_graph_db(
         aa_df = artists.select("id", "similar_artists").filter(pl.col("similar_artists").is_not_null()).collect()
         if not aa_df.is_empty():
             aa_query = """
-            UNWIND $batch AS row
+            UNWIND $rows AS row
             MATCH (a:Artist {id: row.id})
             UNWIND row.similar_artists AS sim_name
             MATCH (target:Artist)
@@ -242,9 +230,7 @@ def ingest_graph_db(
               AND a.id <> target.id
             MERGE (a)-[:SIMILAR_TO]->(target)
             """
-            for batch_df in aa_df.iter_slices(n_rows=1000):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, aa_query, {"batch": batch_data})
+            execute_cypher_batch(driver, aa_query, aa_df.iter_rows(named=True))
         context.log.info("Ingested Artist -> Artist relationships.")
         del aa_df
 
@@ -252,14 +238,12 @@ def ingest_graph_db(
         ra_df = releases.select("id", "artist_id").filter(pl.col("artist_id").is_not_null()).collect()
         if not ra_df.is_empty():
             ra_query = """
-            UNWIND $batch AS row
+            UNWIND $rows AS row
             MATCH (rel:Release {id: row.id})
             MATCH (art:Artist {id: row.artist_id})
             MERGE (rel)-[:PERFORMED_BY]->(art)
             """
-            for batch_df in ra_df.iter_slices(n_rows=1000):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, ra_query, {"batch": batch_data})
+            execute_cypher_batch(driver, ra_query, ra_df.iter_rows(named=True))
         context.log.info("Ingested Release -> Artist relationships.")
         del ra_df
 
@@ -267,16 +251,14 @@ def ingest_graph_db(
         gg_df = genres.select("id", "parent_ids").filter(pl.col("parent_ids").is_not_null()).collect()
         if not gg_df.is_empty():
             gg_query = """
-            UNWIND $batch AS row
+            UNWIND $rows AS row
             MATCH (g:Genre {id: row.id})
             UNWIND row.parent_ids AS pid
             MATCH (parent:Genre {id: pid})
             WHERE g.id <> parent.id
             MERGE (g)-[:SUBGENRE_OF]->(parent)
             """
-            for batch_df in gg_df.iter_slices(n_rows=1000):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, gg_query, {"batch": batch_data})
+            execute_cypher_batch(driver, gg_query, gg_df.iter_rows(named=True))
         context.log.info("Ingested Genre -> Genre relationships.")
         del gg_df
 
@@ -284,14 +266,12 @@ def ingest_graph_db(
         ac_df = artists.select("id", "country").filter(pl.col("country").is_not_null()).collect()
         if not ac_df.is_empty():
             ac_query = """
-            UNWIND $batch AS row
+            UNWIND $rows AS row
             MATCH (a:Artist {id: row.id})
             MATCH (c:Country {name: row.country})
             MERGE (a)-[:FROM_COUNTRY]->(c)
             """
-            for batch_df in ac_df.iter_slices(n_rows=1000):
-                batch_data = batch_df.to_dicts()
-                execute_cypher(driver, ac_query, {"batch": batch_data})
+            execute_cypher_batch(driver, ac_query, ac_df.iter_rows(named=True))
         context.log.info("Ingested Artist -> Country relationships.")
         del ac_df
 
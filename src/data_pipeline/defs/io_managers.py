@@ -7,7 +7,7 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional, Any
 
@@ -15,6 +15,8 @@ import msgspec
 import polars as pl
 from dagster import ConfigurableIOManager, InputContext, OutputContext
 
+from data_pipeline.utils.io_helpers import atomic_publish
+
 
 class BasePolarsIOManager(ConfigurableIOManager):
     """
@@ -67,10 +69,27 @@ class BasePolarsIOManager(ConfigurableIOManager):
                 if context.has_asset_partitions and context.has_partition_key:
                     pk = context.asset_partition_key
         
-        if pk:
-            return Path(self.base_dir) / asset_name / f"{pk}.{self.extension}"
-        
-        return Path(self.base_dir) / f"{asset_name}.{self.extension}"
+        return self._compute_path(self.base_dir, asset_name, pk or None, self.extension)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _compute_path(base_dir: str, asset_name: str, partition_key: Optional[str], extension: str) -> Path:
+        """
+        Builds the file path for an asset, memoized per (asset, partition).
+
+        Args:
+            base_dir: Root directory of the I/O manager.
+            asset_name: Last component of the asset key.
+            partition_key: Optional partition key.
+            extension: File extension without the leading dot.
+
+        Returns:
+            A Path object pointing to the file.
+        """
+        if partition_key:
+            return Path(base_dir) / asset_name / f"{partition_key}.{extension}"
+
+        return Path(base_dir) / f"{asset_name}.{extension}"
 
 
 class PolarsParquetIOManager(BasePolarsIOManager):
@@ -111,7 +130,7 @@ class PolarsParquetIOManager(BasePolarsIOManager):
         else:
             raise TypeError(f"Unsupported output type for Parquet: {type(obj)}")
 
-        shutil.move(str(temp_path), str(path))
+        atomic_publish(temp_path, path)
         context.add_output_metadata({
             "row_count": row_count,
             "path": str(path),
@@ -202,7 +221,7 @@ class PolarsJSONLIOManager(BasePolarsIOManager):
             else:
                 write_item(f, obj)
 
-        shutil.move(str(temp_path), str(path))
+        atomic_publish(temp_path, path)
         
         context.add_output_metadata({
             "row_count": row_count,
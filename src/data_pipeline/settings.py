@@ -77,11 +77,11 @@ class Settings(BaseSettings):
     # WIKIDATA API
     # ==============================================================================
     WIKIDATA_CONCURRENT_REQUESTS: int = 5
-    WIKIDATA_FALLBACK_LANGUAGES: list[str] = [
+    WIKIDATA_FALLBACK_LANGUAGES: tuple[str, ...] = (
         "en", "de", "es", "fr", "it", "ja", "pt", "ru", "zh",
         "nl", "sv", "no", "da", "fi", "ko", "pl", "uk", "tr",
         "ro", "he"
-    ]
+    )
 
     # WIKIDATA SPARQL ENDPOINT API
     WIKIDATA_SPARQL_BATCH_SIZE: int = 500
@@ -112,6 +112,10 @@ class Settings(BaseSettings):
     # NEO4J CONFIGURATION
     # ==============================================================================
     GRAPH_DB_INGESTION_BATCH_SIZE: int = 1000
+    # Driver pool, sized above the number of concurrent writers (env-overridable)
+    NEO4J_MAX_CONNECTION_POOL_SIZE: int = 100
+    NEO4J_CONNECTION_ACQUISITION_TIMEOUT: float = 60.0
+    NEO4J_MAX_TRANSACTION_RETRY_TIME: float = 15.0
 
     # ==============================================================================
     #  STREAMING BUFFER SIZES
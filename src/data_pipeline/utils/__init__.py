@@ -3,6 +3,7 @@ from . import network_helpers
 from . import data_transformation_helpers
 from . import wikidata_helpers
 from . import wikipedia_helpers
+from . import neo4j_driver
 from . import neo4j_helpers
 from . import lastfm_helpers
 from . import chroma_helpers
@@ -9,23 +9,28 @@
 
 import hashlib
 from pathlib import Path
-from typing import cast, Union
+from typing import cast, Union, TYPE_CHECKING
 
 import chromadb
-import torch
 from chromadb.api.client import Client
 from chromadb.api.models.Collection import Collection
 from chromadb import Documents, Embeddings, EmbeddingFunction
-from sentence_transformers import SentenceTransformer
 
+if TYPE_CHECKING:
+    import torch
 
-def get_device() -> torch.device:
+
+def get_device() -> "torch.device":
     """
     Detects the best available compute device.
 
+    torch is imported on first call so importing this module stays cheap.
+
     Returns:
         torch.device: CUDA if available, MPS for Apple Silicon, otherwise CPU.
     """
+    import torch
+
     if torch.cuda.is_available():
         return torch.device("cuda")
     if torch.backends.mps.is_available():
@@ -52,6 +57,9 @@ class NomicEmbeddingFunction(EmbeddingFunction[Documents]):
         super().__init__()
         # We ignore type checking here because EmbeddingFunction protocol might
         # have a different signature, but we need these specific args.
+        # Imported here because sentence_transformers pulls in torch
+        from sentence_transformers import SentenceTransformer
+
         self._model = SentenceTransformer(
             model_name, device=device, trust_remote_code=True
         )
@@ -108,20 +116,25 @@ class NomicEmbeddingFunction(EmbeddingFunction[Documents]):
         return cast(Embeddings, embeddings.tolist())
 
 
-def generate_doc_id(article_text: str, row_hash: str) -> str:
+def generate_doc_id(article_text: Union[str, bytes], row_hash: str) -> str:
     """
     Generates a unique document ID using SHA256.
 
+    Pre-encoded UTF-8 bytes are accepted and yield the same ID as the
+    equivalent string.
+
     Args:
-        article_text: Article content.
+        article_text: Article content, as a string or UTF-8 encoded bytes.
         row_hash: Unique identifier for the row (e.g., 'row_0').
 
     Returns:
         SHA256 hex digest as document ID.
     """
-    combined = f"{article_text}-{row_hash}"
+    if isinstance(article_text, str):
+        article_text = article_text.encode("utf-8")
+    combined = article_text + b"-" + row_hash.encode("utf-8")
     # Truncate to 32 chars to satisfy Nomic Atlas limits (max 36)
-    return hashlib.sha256(combined.encode("utf-8")).hexdigest()[:32]
+    return hashlib.sha256(combined).hexdigest()[:32]
 
 
 def get_chroma_client(db_path: Path) -> Client:
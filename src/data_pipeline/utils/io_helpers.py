@@ -8,7 +8,10 @@
 # -----------------------------------------------------------
 
 import asyncio
+import errno
 import hashlib
+import os
+import shutil
 from pathlib import Path
 from typing import Any, Optional
 
@@ -16,6 +19,22 @@ import msgspec
 
 JSONDecodeError = msgspec.DecodeError
 
+# Reusable msgspec codecs, shared by every JSON helper instead of the one-shot functions
+_JSON_ENCODER = msgspec.json.Encoder()
+_JSON_DECODER = msgspec.json.Decoder()
+
+def _ensure_parent_dir(path: Path) -> None:
+    """
+    Creates the parent directory of a path if it does not exist.
+
+    Checked on every write, so writes keep working if the directory is removed
+    while the process is running.
+
+    Args:
+        path: Path whose parent directory must exist.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
 
 async def async_read_json_file(path: Path) -> Optional[Any]:
     """
@@ -36,7 +55,7 @@ async def async_read_json_file(path: Path) -> Optional[Any]:
                 return f.read()
         
         data = await asyncio.to_thread(read_bytes)
-        return msgspec.json.decode(data)
+        return _JSON_DECODER.decode(data)
     except (OSError, msgspec.DecodeError):
         return None
 
@@ -51,11 +70,10 @@ async def async_write_json_file(path: Path, data: Any) -> None:
         path: Path to the JSON file to write.
         data: Data to be JSON-encoded and written.
     """
-    await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
-
     def write_bytes():
+        _ensure_parent_dir(path)
         with open(path, "wb") as f:
-            f.write(msgspec.json.encode(data))
+            f.write(_JSON_ENCODER.encode(data))
 
     await asyncio.to_thread(write_bytes)
 
@@ -93,15 +111,101 @@ async def async_write_text_file(path: Path, content: str) -> None:
         path: Path to the text file to write.
         content: String content to write.
     """
-    await asyncio.to_thread(path.parent.mkdir, parents=True, exist_ok=True)
-
     def write_text():
+        _ensure_parent_dir(path)
         with open(path, "w", encoding="utf-8") as f:
             f.write(content)
 
     await asyncio.to_thread(write_text)
 
 
+def atomic_publish(src: Path, dst: Path) -> None:
+    """
+    Moves a finished temporary file to its final location.
+
+    Uses an atomic rename when both paths are on the same filesystem and falls
+    back to a copying move only when they are on different devices.
+
+    Args:
+        src: Path to the temporary file.
+        dst: Final destination path.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+
+def get_sharded_path(base_dir: Path, key: str, suffix: str, shard_length: int = 3) -> Path:
+    """
+    Builds a cache file path inside a subdirectory named after the key suffix.
+
+    Sequential IDs differ in their last characters, so sharding on the suffix
+    spreads them evenly (e.g., 'Q123456' -> base_dir/456/Q123456.txt, up to
+    10**shard_length directories for numeric keys).
+
+    Args:
+        base_dir: Root cache directory.
+        key: Cache key used as the file name (e.g., a QID).
+        suffix: File suffix including the dot (e.g., '.txt').
+        shard_length: Number of trailing key characters used as the shard name.
+
+    Returns:
+        The sharded file path.
+    """
+    return base_dir / key[-shard_length:] / f"{key}{suffix}"
+
+
+def adopt_flat_cache_file(base_dir: Path, key: str, suffix: str, shard_length: int = 3) -> bool:
+    """
+    Moves a cache file written before sharding into its sharded location.
+
+    Args:
+        base_dir: Root cache directory.
+        key: Cache key used as the file name (e.g., a QID).
+        suffix: File suffix including the dot (e.g., '.txt').
+        shard_length: Number of trailing key characters used as the shard name.
+
+    Returns:
+        True if a flat file was moved, False if there was nothing to move.
+    """
+    flat_file = base_dir / f"{key}{suffix}"
+    target = get_sharded_path(base_dir, key, suffix, shard_length)
+    if target.exists() or not flat_file.is_file():
+        return False
+    _ensure_parent_dir(target)
+    try:
+        os.replace(flat_file, target)
+    except FileNotFoundError:
+        # Another worker moved it first
+        return False
+    return True
+
+
+def migrate_flat_cache_to_shards(base_dir: Path, suffix: str, shard_length: int = 3) -> int:
+    """
+    Moves every cache file from a flat directory layout into sharded subdirectories.
+
+    Meant to run once before a cache is read, so readers only ever look at the
+    sharded layout. Files already present at the sharded location are left
+    untouched.
+
+    Args:
+        base_dir: Root cache directory.
+        suffix: File suffix of the cache files to migrate (e.g., '.txt').
+        shard_length: Number of trailing key characters used as the shard name.
+
+    Returns:
+        Number of files moved.
+    """
+    return sum(
+        adopt_flat_cache_file(base_dir, flat_file.stem, suffix, shard_length)
+        for flat_file in list(base_dir.glob(f"*{suffix}"))
+    )
+
+
 def generate_cache_key(text: str) -> str:
     """
     Creates a SHA256 hash of a string to use as a cache key.
@@ -125,4 +229,4 @@ def decode_json(data: bytes) -> Any:
     Returns:
         The decoded data.
     """
-    return msgspec.json.decode(data)
+    return _JSON_DECODER.decode(data)
@@ -91,10 +91,11 @@ def generate_text_batch(
     max_tokens: int = 200,
 ) -> list[str]:
     """
-    Generates text for multiple prompts sequentially.
+    Generates text for multiple prompts in a single batched call.
 
-    Note: MLX currently doesn't support true batch inference,
-    so this processes prompts one at a time.
+    All prompts are tokenized with one chat template call and decoded
+    together via `mlx_lm.batch_generate`. Older mlx-lm releases without
+    batched generation fall back to processing prompts one at a time.
 
     Args:
         model: MLX model instance.
@@ -103,10 +104,35 @@ def generate_text_batch(
         max_tokens: Maximum tokens to generate per prompt.
 
     Returns:
-        List of generated text responses.
+        List of generated text responses, in the same order as prompts.
     """
-    responses = []
-    for prompt in prompts:
-        response = generate_text(model, tokenizer, prompt, max_tokens)
-        responses.append(response)
-    return responses
+    if not prompts:
+        return []
+
+    try:
+        from mlx_lm import batch_generate
+    except ImportError:
+        return [
+            generate_text(model, tokenizer, prompt, max_tokens)
+            for prompt in prompts
+        ]
+
+    # Format every prompt as a chat conversation and tokenize them together
+    conversations = [[{"role": "user", "content": prompt}] for prompt in prompts]
+    prompt_tokens = tokenizer.apply_chat_template(
+        conversations,
+        tokenize=True,
+        add_generation_prompt=True,
+        return_dict=False,
+    )
+
+    # Generate all responses in one batch
+    response = batch_generate(
+        model,
+        tokenizer,
+        prompts=prompt_tokens,
+        max_tokens=max_tokens,
+        verbose=False,
+    )
+
+    return [text.strip() for text in response.texts]
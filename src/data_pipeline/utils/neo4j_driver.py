@@ -0,0 +1,156 @@
+# -----------------------------------------------------------
+# Neo4j Driver and Session Cache
+# Dagster Data pipeline for Structured and Unstructured Data
+#
+# (C) 2025-2026 Juan-Francisco Reyes, Cottbus, Germany
+# Released under MIT License
+# email pacoreyes@protonmail.com
+# -----------------------------------------------------------
+
+"""
+Neo4j connection management.
+
+This module provides:
+- A process-wide driver cache, so connection pools are reused
+- A per-thread session cache for session-less queries
+
+It depends only on the neo4j driver, so resources can import it without
+pulling in the graph analysis stack used by neo4j_helpers.
+"""
+
+import atexit
+import hashlib
+import threading
+from typing import Any
+
+from neo4j import Driver, GraphDatabase, Session
+
+from data_pipeline.settings import settings
+
+# Process-wide drivers keyed by connection and pool settings, so the connection pool is reused
+_driver_cache: dict[tuple[Any, ...], Driver] = {}
+_driver_lock = threading.Lock()
+
+# Sessions are not thread-safe, so each thread caches its own per (driver, database)
+_session_local = threading.local()
+
+
+def get_driver(
+    uri: str,
+    auth: tuple[str, str],
+    *,
+    max_connection_pool_size: int | None = None,
+    connection_acquisition_timeout: float | None = None,
+    max_transaction_retry_time: float | None = None,
+    keep_alive: bool = True,
+) -> Driver:
+    """
+    Returns a shared Neo4j driver for the given URI and credentials.
+
+    The driver is created once per process and reused, so its connection pool
+    (TCP, TLS and routing state) survives across queries. All cached drivers are
+    closed at interpreter exit. Calls with different pool settings get separate
+    drivers, so no caller silently inherits another caller's pool.
+
+    Args:
+        uri: Neo4j connection URI.
+        auth: (username, password) tuple.
+        max_connection_pool_size: Maximum connections kept in the pool.
+            Defaults to settings.NEO4J_MAX_CONNECTION_POOL_SIZE.
+        connection_acquisition_timeout: Seconds to wait for a free pooled connection.
+            Defaults to settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT.
+        max_transaction_retry_time: Seconds the driver keeps retrying managed transactions.
+            Defaults to settings.NEO4J_MAX_TRANSACTION_RETRY_TIME.
+        keep_alive: Enable TCP keep-alive so idle pooled connections are not dropped.
+
+    Returns:
+        The cached Neo4j Driver instance.
+    """
+    if max_connection_pool_size is None:
+        max_connection_pool_size = settings.NEO4J_MAX_CONNECTION_POOL_SIZE
+    if connection_acquisition_timeout is None:
+        connection_acquisition_timeout = settings.NEO4J_CONNECTION_ACQUISITION_TIMEOUT
+    if max_transaction_retry_time is None:
+        max_transaction_retry_time = settings.NEO4J_MAX_TRANSACTION_RETRY_TIME
+
+    username, password = auth
+    key = (
+        uri,
+        username,
+        hashlib.sha256(password.encode("utf-8")).hexdigest(),
+        max_connection_pool_size,
+        connection_acquisition_timeout,
+        max_transaction_retry_time,
+        keep_alive,
+    )
+
+    driver = _driver_cache.get(key)
+    if driver is not None:
+        return driver
+
+    with _driver_lock:
+        # Another thread may have created the driver while we waited for the lock
+        driver = _driver_cache.get(key)
+        if driver is None:
+            driver = GraphDatabase.driver(
+                uri,
+                auth=auth,
+                max_connection_pool_size=max_connection_pool_size,
+                connection_acquisition_timeout=connection_acquisition_timeout,
+                max_transaction_retry_time=max_transaction_retry_time,
+                keep_alive=keep_alive,
+            )
+            _driver_cache[key] = driver
+    return driver
+
+
+@atexit.register
+def close_drivers() -> None:
+    """
+    Closes and forgets every cached Neo4j driver.
+    """
+    close_thread_sessions()
+    with _driver_lock:
+        for driver in _driver_cache.values():
+            driver.close()
+        _driver_cache.clear()
+
+
+def _session_for(driver: Driver, database: str | None = None) -> Session:
+    """
+    Returns the calling thread's cached session for the driver, opening one if needed.
+
+    Args:
+        driver: Neo4j Driver instance.
+        database: Target database name. None uses the server default.
+
+    Returns:
+        An open session owned by the calling thread.
+    """
+    sessions = getattr(_session_local, "sessions", None)
+    if sessions is None:
+        sessions = _session_local.sessions = {}
+
+    # The driver object is kept alongside its session so a recycled id() never matches
+    key = (id(driver), database)
+    cached = sessions.get(key)
+    if cached is not None and cached[0] is driver and not cached[1].closed():
+        return cached[1]
+
+    session = driver.session(database=database)
+    sessions[key] = (driver, session)
+    return session
+
+
+def close_thread_sessions() -> None:
+    """
+    Closes the sessions cached by `_session_for` on the calling thread.
+
+    Sessions owned by other threads are left alone; each thread closes its own.
+    """
+    sessions = getattr(_session_local, "sessions", None)
+    if not sessions:
+        return
+    for _, session in sessions.values():
+        session.close()
+    sessions.clear()
@@ -16,15 +16,48 @@ This module provides:
 - Generic graph construction and community detection
 """
 
+import os
+import random
+import re
 import time
-from collections import Counter
-from typing import Any, LiteralString, cast
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Literal, LiteralString, cast
 
 import igraph as ig
 import leidenalg
+import numpy as np
 from dagster import AssetExecutionContext
-from neo4j import Driver
-from neo4j.exceptions import ServiceUnavailable, SessionExpired
+from neo4j import Driver, Session
+from neo4j.exceptions import (
+    Neo4jError,
+    ServiceUnavailable,
+    SessionExpired,
+    TransientError,
+    WriteServiceUnavailable,
+)
+
+from data_pipeline.utils.neo4j_driver import _session_for
+
+# Failures worth retrying; anything else (e.g. ClientError for bad Cypher) fails fast.
+# Server errors in this tuple are further filtered by `_is_retryable`.
+_RETRY_EXC = (ServiceUnavailable, SessionExpired, TransientError, WriteServiceUnavailable)
+
+# Shared jitter source for retry backoff, seeded once per process
+_retry_rng = random.Random()
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """
+    Returns whether a failure caught via `_RETRY_EXC` should be retried.
+
+    Server-side errors carry their own verdict (e.g. a transaction terminated by
+    an operator is a TransientError that must not be retried), so Neo4jError
+    subclasses defer to `is_retryable()`; connectivity errors are always retried.
+    """
+    if isinstance(exc, Neo4jError):
+        return exc.is_retryable()
+    return True
 
 
 def execute_cypher(
@@ -32,7 +65,8 @@ def execute_cypher(
     query: str,
     params: dict[str, Any] | None = None,
     database: str = "neo4j",
-    transactional: bool = True
+    transactional: bool = True,
+    session: Session | None = None,
 ) -> None:
     """
     Executes a Cypher query with optional parameters using the Neo4j driver.
@@ -45,53 +79,137 @@ def execute_cypher(
         transactional: If True, uses execute_write (managed transaction with retries).
                        If False, uses session.run (auto-commit transaction), required for
                        schema operations (CREATE INDEX) or batched transactions (CALL ... IN TRANSACTIONS).
+        session: Optional open session to reuse. If given, it is already bound to its
+                 database, so `database` must be left at its default. If None, the
+                 calling thread's cached session for `database` is used (see `_session_for`).
+
+    Raises:
+        ValueError: If both `session` and a non-default `database` are given.
     """
-    try:
-        with driver.session(database=database) as session:
-            if transactional:
-                def _work(tx, q, p):
-                    tx.run(q, p).consume()
-                session.execute_write(_work, cast(LiteralString, query), params or {})
-            else:
-                # We cast to LiteralString because schema-altering queries cannot be parameterized
-                session.run(cast(LiteralString, query), params or {}).consume()
-    except Exception as e:
-        raise e
+    if session is not None and database != "neo4j":
+        raise ValueError(
+            f"database={database!r} cannot be combined with an explicit session; "
+            "open the session on that database instead"
+        )
+    active_session = session if session is not None else _session_for(driver, database)
+
+    if transactional:
+        _execute_with_retry(
+            driver, query, params=params, session=active_session, fetch="none"
+        )
+    else:
+        # We cast to LiteralString because schema-altering queries cannot be parameterized
+        active_session.run(cast(LiteralString, query), params or {}).consume()
+
+
+def execute_cypher_batch(
+    driver: Driver,
+    query: str,
+    rows: Iterable[dict[str, Any]],
+    chunk_size: int = 1000,
+    database: str = "neo4j",
+) -> int:
+    """
+    Executes a bulk write query over rows in chunks, one managed transaction per chunk.
+
+    The query must unwind the `$rows` parameter itself, e.g.
+    "UNWIND $rows AS row MERGE (n:Genre {id: row.id}) SET n += row".
+    All chunks share one session, so N rows cost ceil(N / chunk_size) round-trips.
+
+    Args:
+        driver: Neo4j Driver instance.
+        query: Cypher query string referencing `$rows`.
+        rows: Row dicts to write. Consumed lazily, so only one chunk is held at a time.
+        chunk_size: Number of rows sent per transaction.
+        database: Target database name.
+
+    Returns:
+        Number of rows sent to the server.
+    """
+    def _work(tx, q, chunk):
+        tx.run(q, {"rows": chunk}).consume()
+
+    row_iter = iter(rows)
+    chunk = list(islice(row_iter, chunk_size))
+    if not chunk:
+        return 0
+
+    sent = 0
+    with driver.session(database=database) as session:
+        while chunk:
+            session.execute_write(_work, cast(LiteralString, query), chunk)
+            sent += len(chunk)
+            chunk = list(islice(row_iter, chunk_size))
+    return sent
 
 
 def _execute_with_retry(
     driver: Driver,
     query: str,
-    max_retries: int = 3,
+    *,
+    params: dict[str, Any] | None = None,
+    max_retries: int = 0,
     base_delay: float = 2.0,
+    session: Session | None = None,
+    jitter: float = 0.5,
+    max_delay: float = 30.0,
+    fetch: Literal["none", "single", "all"] = "single",
 ) -> Any:
     """
-    Executes a Cypher query with retry logic for transient connection failures.
+    Executes a write query in a managed transaction and returns its result.
+
+    Transient failures are retried by the driver inside `execute_write`, bounded
+    by the driver's `max_transaction_retry_time` (see `neo4j_driver.get_driver`). The outer
+    retry loop is kept only for backwards compatibility and is off by default,
+    so backoff windows do not compound.
 
     Args:
         driver: Neo4j Driver instance.
         query: Cypher query to execute.
-        max_retries: Maximum number of retry attempts.
-        base_delay: Base delay in seconds for exponential backoff.
+        params: Dictionary of query parameters.
+        max_retries: Deprecated. Extra caller-level attempts after the driver gives up.
+        base_delay: Deprecated. Base delay in seconds for the caller-level backoff.
+        session: Optional open session to reuse. If None, the calling thread's
+                 cached session is used (see `_session_for`). A session acquires a
+                 fresh connection from the pool on each transaction, so it stays
+                 usable after a transient failure.
+        jitter: Maximum random fraction added to each backoff delay, so concurrent
+                workers do not retry in lockstep.
+        max_delay: Upper bound in seconds for a single backoff delay.
+        fetch: How to materialize the result inside the transaction: "single"
+               returns one record (or None), "all" returns every record from one
+               pull, and "none" consumes the result and returns None.
 
     Returns:
-        The single result from the query, or None if no results.
+        The single record, the list of records, or None, depending on `fetch`.
 
     Raises:
-        The last exception if all retries are exhausted.
+        The last exception if all retries are exhausted. Non-transient errors
+        (anything outside `_RETRY_EXC`, or a server error whose `is_retryable()`
+        is False) are raised on the first attempt.
     """
+    if fetch == "single":
+        def _work(tx, q, p):
+            return tx.run(q, p).single()
+    elif fetch == "all":
+        def _work(tx, q, p):
+            return list(tx.run(q, p))
+    elif fetch == "none":
+        def _work(tx, q, p):
+            tx.run(q, p).consume()
+    else:
+        raise ValueError(f"Unknown fetch mode: {fetch!r}")
+
     last_exception = None
     for attempt in range(max_retries + 1):
         try:
-            with driver.session() as session:
-                # noinspection SqlNoDataSourceInspection
-                result = session.run(cast(LiteralString, query)).single()
-                return result
-        except (ServiceUnavailable, SessionExpired) as e:
+            active_session = session if session is not None else _session_for(driver)
+            return active_session.execute_write(_work, cast(LiteralString, query), params or {})
+        except _RETRY_EXC as e:
             last_exception = e
-            if attempt < max_retries:
-                delay = base_delay * (2 ** attempt)
-                time.sleep(delay)
+            if attempt < max_retries and _is_retryable(e):
+                delay = base_delay * (2 ** attempt) * (1 + _retry_rng.random() * jitter)
+                time.sleep(min(delay, max_delay))
             else:
                 raise last_exception
     
@@ -100,6 +218,110 @@ def _execute_with_retry(
     raise ServiceUnavailable("Failed to execute query after retries with no captured exception.")
 
 
+def _supports_call_in_transactions(driver: Driver) -> bool:
+    """
+    Checks whether the server supports `CALL { ... } IN TRANSACTIONS` (Neo4j 4.4+).
+
+    Args:
+        driver: Neo4j Driver instance.
+
+    Returns:
+        True if the server version is 4.4 or newer, False if older or unknown.
+    """
+    try:
+        agent = str(driver.get_server_info().agent)
+    except Exception:
+        return False
+    match = re.search(r"Neo4j/(\d+)\.(\d+)", agent)
+    if not match:
+        return False
+    return (int(match.group(1)), int(match.group(2))) >= (4, 4)
+
+
+def _delete_in_server_batches(session: Session, batch_size: int) -> tuple[int, int]:
+    """
+    Deletes all relationships, then all nodes, with server-side batched transactions.
+
+    Each phase is a single auto-commit statement; the server commits every
+    `batch_size` rows itself, so no per-batch round-trip is needed.
+
+    Args:
+        session: Open Neo4j session.
+        batch_size: Number of rows deleted per inner transaction.
+
+    Returns:
+        Tuple of (relationships deleted, nodes deleted).
+    """
+    # noinspection SqlNoDataSourceInspection
+    rels_summary = session.run(cast(LiteralString, (
+        f"MATCH ()-[r]->() CALL {{ WITH r DELETE r }} IN TRANSACTIONS OF {int(batch_size)} ROWS"
+    ))).consume()
+    # noinspection SqlNoDataSourceInspection
+    nodes_summary = session.run(cast(LiteralString, (
+        f"MATCH (n) CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {int(batch_size)} ROWS"
+    ))).consume()
+    return rels_summary.counters.relationships_deleted, nodes_summary.counters.nodes_deleted
+
+
+def _delete_in_client_batches(
+    driver: Driver,
+    session: Session,
+    context: AssetExecutionContext,
+    batch_size: int,
+) -> tuple[int, int]:
+    """
+    Deletes all relationships, then all nodes, one LIMIT-ed batch per round-trip.
+
+    Fallback for servers older than Neo4j 4.4. Each batch is retried on
+    transient connection failures.
+
+    Args:
+        driver: Neo4j Driver instance.
+        session: Open Neo4j session reused by every batch.
+        context: Dagster execution context for logging.
+        batch_size: Number of rows deleted per batch.
+
+    Returns:
+        Tuple of (relationships deleted, nodes deleted).
+    """
+    # 1. Delete relationships first (faster than DETACH DELETE on nodes)
+    total_rels_deleted = 0
+    while True:
+        # noinspection SqlNoDataSourceInspection
+        result = _execute_with_retry(
+            driver,
+            f"MATCH ()-[r]->() WITH r LIMIT {batch_size} DELETE r RETURN count(*) AS deleted",
+            session=session,
+        )
+        deleted = result["deleted"] if result else 0
+        if deleted == 0:
+            break
+        total_rels_deleted += deleted
+        context.log.debug(f"Deleted {deleted} relationships (total: {total_rels_deleted})")
+
+    # 2. Delete nodes (now without relationships, much faster)
+    total_nodes_deleted = 0
+    while True:
+        # noinspection SqlNoDataSourceInspection
+        result = _execute_with_retry(
+            driver,
+            f"MATCH (n) WITH n LIMIT {batch_size} DELETE n RETURN count(*) AS deleted",
+            session=session,
+        )
+        deleted = result["deleted"] if result else 0
+        if deleted == 0:
+            break
+        total_nodes_deleted += deleted
+        context.log.debug(f"Deleted {deleted} nodes (total: {total_nodes_deleted})")
+
+    return total_rels_deleted, total_nodes_deleted
+
+
+def _quote_identifier(name: str) -> str:
+    """Backtick-quotes a Cypher identifier, escaping embedded backticks."""
+    return "`" + name.replace("`", "``") + "`"
+
+
 def clear_database(
     driver: Driver,
     context: AssetExecutionContext,
@@ -108,9 +330,11 @@ def clear_database(
     """
     Clears all nodes, relationships, and indexes from the database.
 
-    Uses an iterative batch deletion approach with fresh sessions for each batch
-    and retry logic, which is required for Neo4j Aura cloud instances that have
-    connection timeouts.
+    On Neo4j 4.4+ each phase is one `CALL { ... } IN TRANSACTIONS` statement,
+    batched server-side. Older servers, or a transient failure during the
+    server-side delete, fall back to an iterative batch deletion with retry
+    logic, which suits Neo4j Aura cloud instances that have connection timeouts.
+    A single session is opened for the whole cleanup and reused by every statement.
 
     Args:
         driver: Neo4j Driver instance.
@@ -120,69 +344,59 @@ def clear_database(
     context.log.info("Starting database cleanup...")
 
     try:
-        # 1. Delete relationships first (faster than DETACH DELETE on nodes)
-        total_rels_deleted = 0
-        while True:
-            # noinspection SqlNoDataSourceInspection
-            result = _execute_with_retry(
-                driver,
-                f"MATCH ()-[r]->() WITH r LIMIT {batch_size} DELETE r RETURN count(*) AS deleted"
-            )
-            deleted = result["deleted"] if result else 0
-            if deleted == 0:
-                break
-            total_rels_deleted += deleted
-            context.log.debug(f"Deleted {deleted} relationships (total: {total_rels_deleted})")
-
-        if total_rels_deleted > 0:
-            context.log.info(f"Deleted {total_rels_deleted} relationships.")
-
-        # 2. Delete nodes (now without relationships, much faster)
-        total_nodes_deleted = 0
-        while True:
-            # noinspection SqlNoDataSourceInspection
-            result = _execute_with_retry(
-                driver,
-                f"MATCH (n) WITH n LIMIT {batch_size} DELETE n RETURN count(*) AS deleted"
-            )
-            deleted = result["deleted"] if result else 0
-            if deleted == 0:
-                break
-            total_nodes_deleted += deleted
-            context.log.debug(f"Deleted {deleted} nodes (total: {total_nodes_deleted})")
-
-        context.log.info(f"Deleted {total_nodes_deleted} nodes.")
-
-        # 3. Drop all indexes
-        with driver.session() as session:
+        with driver.session(database="neo4j") as session:
+            total_rels_deleted = 0
+            total_nodes_deleted = 0
+            deleted_server_side = False
+            if _supports_call_in_transactions(driver):
+                try:
+                    total_rels_deleted, total_nodes_deleted = _delete_in_server_batches(
+                        session, batch_size
+                    )
+                    deleted_server_side = True
+                except _RETRY_EXC as e:
+                    if not _is_retryable(e):
+                        raise
+                    # Committed batches stay deleted; the loop removes the remainder
+                    context.log.warning(f"Server-side batched delete failed, falling back: {e}")
+
+            if not deleted_server_side:
+                total_rels_deleted, total_nodes_deleted = _delete_in_client_batches(
+                    driver, session, context, batch_size
+                )
+
+            if total_rels_deleted > 0:
+                context.log.info(f"Deleted {total_rels_deleted} relationships.")
+            context.log.info(f"Deleted {total_nodes_deleted} nodes.")
+
+            # Drop schema: list everything first, then constraints (which also
+            # removes their backing indexes), then the remaining explicit indexes
             # noinspection SqlNoDataSourceInspection
             indexes = session.run("SHOW INDEXES").data()
-            for idx in indexes:
-                # Filter system indexes or those we shouldn't touch if necessary
-                name = idx.get("name")
-                type_ = idx.get("type", "").lower()
-                
-                # We only drop explicitly created indexes (RANGE, POINT, TEXT)
-                if name and type_ in ["range", "point", "text", "btree"]: 
-                    try:
-                        # noinspection SqlNoDataSourceInspection
-                        session.run(cast(LiteralString, f"DROP INDEX {name}"))
-                        context.log.info(f"Dropped index: {name}")
-                    except Exception as e:
-                        context.log.warning(f"Failed to drop index {name}: {e}")
-
-            # Drop constraints as well if they exist
             # noinspection SqlNoDataSourceInspection
             constraints = session.run("SHOW CONSTRAINTS").data()
-            for const in constraints:
-                name = const.get("name")
-                if name:
-                    try:
-                        # noinspection SqlNoDataSourceInspection
-                        session.run(cast(LiteralString, f"DROP CONSTRAINT {name}"))
-                        context.log.info(f"Dropped constraint: {name}")
-                    except Exception as e:
-                        context.log.warning(f"Failed to drop constraint {name}: {e}")
+
+            drops: list[tuple[str, str]] = [
+                ("constraint", const["name"]) for const in constraints if const.get("name")
+            ]
+            # We only drop explicitly created indexes (RANGE, POINT, TEXT)
+            drops += [
+                ("index", idx["name"])
+                for idx in indexes
+                if idx.get("name")
+                and idx.get("type", "").lower() in ["range", "point", "text", "btree"]
+            ]
+
+            for kind, name in drops:
+                try:
+                    # Schema names cannot be parameters, so quote them as identifiers
+                    # noinspection SqlNoDataSourceInspection
+                    session.run(cast(LiteralString, (
+                        f"DROP {kind.upper()} {_quote_identifier(name)} IF EXISTS"
+                    ))).consume()
+                    context.log.info(f"Dropped {kind}: {name}")
+                except Exception as e:
+                    context.log.warning(f"Failed to drop {kind} {name}: {e}")
 
     except Exception as e:
         context.log.error(f"Error during database cleanup: {e}")
@@ -211,20 +425,22 @@ def build_igraph(
     Returns:
         Tuple of (graph, id_to_index mapping).
     """
-    # Build ID to index mapping
-    id_to_idx = {node[node_id_key]: idx for idx, node in enumerate(nodes)}
+    # Build ID to index mapping from a single pass over the node IDs
+    node_ids = [node[node_id_key] for node in nodes]
+    id_to_idx = {node_id: idx for idx, node_id in enumerate(node_ids)}
 
     # Convert edges to index pairs, filtering invalid edges
-    edge_indices = []
-    for source_id, target_id in edges:
-        if source_id in id_to_idx and target_id in id_to_idx:
-            edge_indices.append((id_to_idx[source_id], id_to_idx[target_id]))
+    edge_indices = [
+        (id_to_idx[source_id], id_to_idx[target_id])
+        for source_id, target_id in edges
+        if source_id in id_to_idx and target_id in id_to_idx
+    ]
 
-    # Create graph
+    # Create graph in one constructor call
     g = ig.Graph(n=len(nodes), edges=edge_indices, directed=False)
 
     # Set node IDs as vertex attribute
-    g.vs[node_id_key] = [node[node_id_key] for node in nodes]
+    g.vs[node_id_key] = node_ids
 
     # Copy additional node attributes if specified
     if node_attrs:
@@ -234,10 +450,53 @@ def build_igraph(
     return g, id_to_idx
 
 
+def _leiden_membership(
+    graph: ig.Graph,
+    resolution: float,
+    seed: int,
+    initial_membership: list[int] | None = None,
+) -> list[int]:
+    """Runs one Leiden pass; module-level so process pool workers can unpickle it."""
+    partition = leidenalg.find_partition(
+        graph,
+        leidenalg.RBConfigurationVertexPartition,
+        initial_membership=initial_membership,
+        resolution_parameter=resolution,
+        seed=seed,
+    )
+    return partition.membership
+
+
+def _leiden_membership_contracted(
+    graph: ig.Graph,
+    resolution: float,
+    seed: int,
+    finer_membership: list[int],
+) -> list[int]:
+    """Runs Leiden on the graph collapsed by finer_membership and expands the result."""
+    partition = leidenalg.RBConfigurationVertexPartition(
+        graph,
+        initial_membership=finer_membership,
+        resolution_parameter=resolution,
+    )
+    # The aggregate graph carries edge multiplicities, self-loops and node sizes,
+    # so its quality function matches the full graph's for community-level moves
+    aggregate = partition.aggregate_partition()
+    optimiser = leidenalg.Optimiser()
+    optimiser.set_rng_seed(seed)
+    optimiser.optimise_partition(aggregate, n_iterations=2)
+    partition.from_coarse_partition(aggregate)
+    partition.renumber_communities()
+    return partition.membership
+
+
 def run_leiden_multilevel(
     graph: ig.Graph,
     resolutions: list[float],
     seed: int = 42,
+    max_workers: int | None = None,
+    warm_start: bool = False,
+    contract: bool = False,
 ) -> list[list[int]]:
     """
     Runs Leiden community detection at multiple resolution levels.
@@ -245,27 +504,59 @@ def run_leiden_multilevel(
     Higher resolution values produce more (smaller) communities.
     Lower resolution values produce fewer (larger) communities.
 
+    By default each level is detected independently on the full graph, in
+    parallel worker processes (leidenalg holds the GIL and seeds a process-global
+    RNG, ruling out threads). Every level uses the same seed as a serial run, so
+    results do not depend on scheduling. With
+    warm_start, levels run from the highest resolution down and each level
+    starts from the previous level's membership instead of singletons, which
+    usually needs fewer optimization passes. Leiden may still move individual
+    vertices between communities, so warm-started levels are not guaranteed to
+    nest, and results differ from independent runs.
+
+    With contract (warm start only), each coarser level is optimized on the
+    graph collapsed by the previous level's communities, so levels after the
+    first cost roughly one pass over the communities instead of the vertices.
+    Coarse communities are then always unions of finer ones.
+
     Args:
         graph: igraph Graph object.
         resolutions: List of resolution parameters (e.g., [2.0, 0.5, 0.1]).
         seed: Random seed for reproducibility.
+        max_workers: Worker process cap for independent levels.
+            Defaults to min(len(resolutions), cpu count); 1 runs serially.
+        warm_start: Seed each level with the next finer level's partition.
+        contract: Optimize coarser levels on the contracted graph. Requires warm_start.
 
     Returns:
-        List of membership lists, one per resolution level.
+        List of membership lists, one per resolution level, in the caller's order.
         Each membership list maps vertex index to community ID.
     """
-    memberships = []
-
-    for resolution in resolutions:
-        partition = leidenalg.find_partition(
-            graph,
-            leidenalg.RBConfigurationVertexPartition,
-            resolution_parameter=resolution,
-            seed=seed,
-        )
-        memberships.append(partition.membership)
+    if contract and not warm_start:
+        raise ValueError("contract=True requires warm_start=True")
+
+    if warm_start:
+        memberships: list[list[int]] = [[] for _ in resolutions]
+        previous: list[int] | None = None
+        for idx in sorted(range(len(resolutions)), key=lambda i: resolutions[i], reverse=True):
+            if contract and previous is not None:
+                previous = _leiden_membership_contracted(graph, resolutions[idx], seed, previous)
+            else:
+                previous = _leiden_membership(graph, resolutions[idx], seed, previous)
+            memberships[idx] = previous
+        return memberships
+
+    workers = min(len(resolutions), max_workers or os.cpu_count() or 1)
+
+    if workers <= 1:
+        return [_leiden_membership(graph, resolution, seed) for resolution in resolutions]
 
-    return memberships
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_leiden_membership, graph, resolution, seed)
+            for resolution in resolutions
+        ]
+        return [future.result() for future in futures]
 
 
 def get_community_stats(membership: list[int]) -> dict[str, Any]:
@@ -278,13 +569,23 @@ def get_community_stats(membership: list[int]) -> dict[str, Any]:
     Returns:
         Dict with num_communities, sizes (sorted descending), and modularity info.
     """
-    counts = Counter(membership)
-    sizes = sorted(counts.values(), reverse=True)
+    if not membership:
+        return {
+            "num_communities": 0,
+            "sizes": [],
+            "largest": 0,
+            "smallest": 0,
+            "mean_size": 0,
+        }
+
+    # Community IDs are dense non-negative integers, so bincount gives every size at once
+    counts = np.bincount(np.asarray(membership, dtype=np.int64))
+    nonzero = counts[counts > 0]
 
     return {
-        "num_communities": len(counts),
-        "sizes": sizes,
-        "largest": sizes[0] if sizes else 0,
-        "smallest": sizes[-1] if sizes else 0,
-        "mean_size": sum(sizes) / len(sizes) if sizes else 0,
+        "num_communities": int(nonzero.size),
+        "sizes": sorted(nonzero.tolist(), reverse=True),
+        "largest": int(nonzero.max()),
+        "smallest": int(nonzero.min()),
+        "mean_size": float(nonzero.mean()),
     }
@@ -8,13 +8,15 @@
 # -----------------------------------------------------------
 
 import asyncio
-from typing import Any, Callable, Coroutine, Optional, TypeVar, AsyncIterable, cast
+from collections import deque
+from contextlib import asynccontextmanager
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Coroutine, Optional, Sequence, TypeVar, AsyncIterable, cast
 
 from curl_cffi.requests import AsyncSession as AsyncClient
 from curl_cffi.requests import Response
 from curl_cffi.requests.errors import RequestsError as HTTPError
 from dagster import AssetExecutionContext
-from tqdm.asyncio import tqdm_asyncio
 from tqdm.asyncio import tqdm
 
 T = TypeVar("T")
@@ -25,7 +27,7 @@ async def make_async_request_with_retries(
     context: AssetExecutionContext,
     url: str,
     method: str = "POST",
-    params: Optional[dict[str, Any]] = None,
+    params: Optional[dict[str, Any] | Sequence[tuple[str, Any]]] = None,
     headers: Optional[dict[str, str]] = None,
     max_retries: int = 5,
     initial_backoff: int = 2,
@@ -41,7 +43,8 @@ async def make_async_request_with_retries(
         context (AssetExecutionContext): Dagster execution context.
         url (str): The target URL.
         method (str): HTTP method.
-        params (Optional[dict[str, Any]]): Query parameters or data.
+        params (Optional[dict[str, Any] | Sequence[tuple[str, Any]]]): Query parameters
+            or data, as a dict or a sequence of (key, value) pairs.
         headers (Optional[dict[str, str]]): HTTP headers.
         max_retries (int): Maximum retries.
         initial_backoff (int): Initial backoff seconds.
@@ -98,6 +101,34 @@ async def make_async_request_with_retries(
     )
 
 
+def _check_concurrency_limit(concurrency_limit: int) -> None:
+    """Rejects a concurrency limit that would start no workers."""
+    if concurrency_limit < 1:
+        raise ValueError(f"concurrency_limit must be at least 1, got {concurrency_limit}")
+
+
+def _chunked(items: list[T], batch_size: int) -> list[list[T]]:
+    """Splits items into consecutive batches of at most batch_size."""
+    return [items[i: i + batch_size] for i in range(0, len(items), batch_size)]
+
+
+@asynccontextmanager
+async def _borrowed_client(
+    client: Optional[AsyncClient],
+    timeout: int,
+    impersonate: Optional[str],
+) -> AsyncIterator[AsyncClient]:
+    """Yields the given client, or a new one that is closed on exit."""
+    if client is not None:
+        yield client
+        return
+    owned = AsyncClient(timeout=timeout, impersonate=impersonate)
+    try:
+        yield owned
+    finally:
+        await owned.close()
+
+
 async def run_tasks_concurrently(
     items: list[T],
     processor: Callable[[T], Coroutine[Any, Any, R]],
@@ -105,7 +136,10 @@ async def run_tasks_concurrently(
     description: str = "Processing",
 ) -> list[R]:
     """
-    Runs a list of async tasks concurrently with a semaphore limit and a progress bar.
+    Runs a list of async tasks concurrently with a fixed worker pool and a progress bar.
+
+    Only `concurrency_limit` worker coroutines exist at any time; they pull items
+    from a shared queue, so large inputs do not create one coroutine per item.
 
     Args:
         items (list[T]): List of items to process.
@@ -115,15 +149,42 @@ async def run_tasks_concurrently(
 
     Returns:
         list[R]: List of results in the order of the input items.
+
+    Raises:
+        ValueError: If concurrency_limit is less than 1.
     """
-    semaphore = asyncio.Semaphore(concurrency_limit)
+    _check_concurrency_limit(concurrency_limit)
+    if not items:
+        return []
+
+    queue: asyncio.Queue[tuple[int, T]] = asyncio.Queue()
+    for entry in enumerate(items):
+        queue.put_nowait(entry)
+    results: list[Any] = [None] * len(items)
 
-    async def sem_task(item: T) -> R:
-        async with semaphore:
-            return await processor(item)
+    with tqdm(total=len(items), desc=description) as progress:
+        async def worker() -> None:
+            # Every item is enqueued up front, so an empty queue means the work is done
+            while True:
+                try:
+                    idx, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[idx] = await processor(item)
+                progress.update(1)
 
-    tasks = [sem_task(item) for item in items]
-    return await tqdm_asyncio.gather(*tasks, desc=description)
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(concurrency_limit, len(items)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+
+    return cast(list[R], results)
 
 
 async def yield_batches_concurrently(
@@ -151,23 +212,80 @@ async def yield_batches_concurrently(
 
     Yields:
         Lists of results from the processed batches.
+
+    Raises:
+        ValueError: If concurrency_limit is less than 1.
     """
-    chunks = [items[i: i + batch_size] for i in range(0, len(items), batch_size)]
+    _check_concurrency_limit(concurrency_limit)
+    chunks = _chunked(items, batch_size)
     semaphore = asyncio.Semaphore(concurrency_limit)
-    should_close_client = False
-    if client is None:
-        client = AsyncClient(timeout=timeout, impersonate=impersonate)
-        should_close_client = True
-    try:
+    async with _borrowed_client(client, timeout, impersonate) as active_client:
         async def worker(batch: list[T]) -> list[R]:
             async with semaphore:
-                return await processor_fn(batch, client)
+                return await processor_fn(batch, active_client)
         tasks = [worker(chunk) for chunk in chunks]
 
         # Use tqdm to wrap the as_completed iterator
         for future in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc=description):
             batch_results = await future
             yield batch_results
-    finally:
-        if should_close_client:
-            await client.close()
+
+
+async def yield_batches_in_order(
+    items: list[T],
+    batch_size: int,
+    processor_fn: Callable[[list[T], AsyncClient], Coroutine[Any, Any, list[R]]],
+    concurrency_limit: int,
+    description: str = "Processing Batches",
+    timeout: int = 60,
+    client: Optional[AsyncClient] = None,
+    impersonate: Optional[str] = "chrome",
+) -> AsyncIterable[list[R]]:
+    """
+    Processes a list of items in batches concurrently and yields results in input order.
+
+    At most `concurrency_limit` batches are in flight at any time. Each batch result is
+    yielded as soon as it and all preceding batches have completed, so the consumer can
+    start working while the remaining batches are still being fetched.
+
+    Args:
+        items: List of items to process.
+        batch_size: Number of items per batch.
+        processor_fn: Async function that takes a batch and a client, returning a list of results.
+        concurrency_limit: Max number of concurrent batches.
+        description: Progress bar description. Defaults to "Processing Batches".
+        timeout: Timeout for the HTTP client. Defaults to 60.
+        client: Optional existing client to reuse.
+        impersonate: Browser fingerprint to impersonate (default: "chrome").
+
+    Yields:
+        Lists of results from the processed batches, in the order of the input items.
+
+    Raises:
+        ValueError: If concurrency_limit is less than 1.
+    """
+    _check_concurrency_limit(concurrency_limit)
+    chunks = iter(_chunked(items, batch_size))
+    total_chunks = -(-len(items) // batch_size)
+    active_tasks: deque[asyncio.Task[list[R]]] = deque()
+    async with _borrowed_client(client, timeout, impersonate) as active_client:
+        try:
+            for chunk in islice(chunks, concurrency_limit):
+                active_tasks.append(asyncio.create_task(processor_fn(chunk, active_client)))
+
+            with tqdm(total=total_chunks, desc=description) as progress:
+                while active_tasks:
+                    batch_results = await active_tasks.popleft()
+                    # Refill the window before yielding so fetching overlaps with the consumer
+                    next_chunk = next(chunks, None)
+                    if next_chunk is not None:
+                        active_tasks.append(
+                            asyncio.create_task(processor_fn(next_chunk, active_client))
+                        )
+                    progress.update(1)
+                    yield batch_results
+        finally:
+            # Await the cancelled tasks so none is left pending when the client closes
+            for task in active_tasks:
+                task.cancel()
+            await asyncio.gather(*active_tasks, return_exceptions=True)
@@ -9,8 +9,9 @@
 
 import asyncio
 import hashlib
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable, Optional, cast
+from typing import Any, Callable, Iterable, Optional, Sequence, cast
 
 from dagster import AssetExecutionContext
 
@@ -27,6 +28,50 @@ from data_pipeline.utils.io_helpers import (
     JSONDecodeError
 )
 
+# Resolved labels keyed by (QID, primary language, fallback languages), least recently
+# used first. The same countries and genres are resolved again in every batch of a run;
+# assets call clear_label_cache() at start so labels never outlive a run.
+_LABEL_CACHE_MAXSIZE = 100_000
+_label_cache: OrderedDict[tuple[str, str, tuple[str, ...]], str] = OrderedDict()
+
+
+def _remember_label(key: tuple[str, str, tuple[str, ...]], label: str) -> None:
+    """Stores a resolved label, evicting the least recently used entry when full."""
+    _label_cache[key] = label
+    _label_cache.move_to_end(key)
+    if len(_label_cache) > _LABEL_CACHE_MAXSIZE:
+        _label_cache.popitem(last=False)
+
+
+def _recall_label(key: tuple[str, str, tuple[str, ...]]) -> Optional[str]:
+    """Returns a cached label and marks it as recently used, or None on a miss."""
+    label = _label_cache.get(key)
+    if label is not None:
+        _label_cache.move_to_end(key)
+    return label
+
+
+def clear_label_cache() -> None:
+    """Empties the resolved label cache; called at the start of every asset that resolves labels."""
+    _label_cache.clear()
+
+
+def load_wikidata(payload: bytes | str) -> dict[str, Any]:
+    """
+    Decodes a Wikidata API payload with the shared msgspec decoder.
+
+    Avoids `Response.json()`, which decodes the body to str and parses it with
+    the stdlib json module; entity batches carry claims, sitelinks and labels
+    in many languages, so parsing dominates the cost of a fetch.
+
+    Args:
+        payload: Raw JSON response body.
+
+    Returns:
+        The decoded JSON object.
+    """
+    return decode_json(cast(Any, payload))
+
 
 async def run_extraction_pipeline(
     context: AssetExecutionContext,
@@ -190,7 +235,7 @@ async def async_fetch_wikidata_entities_batch(
     qids: list[str],
     api_url: str,
     cache_dir: Path,
-    languages: Optional[list[str]] = None,
+    languages: Optional[Sequence[str]] = None,
     timeout: int = 60,
     rate_limit_delay: float = 0.0,
     concurrency_limit: int = 5,
@@ -270,7 +315,7 @@ async def async_fetch_wikidata_entities_batch(
                 rate_limit_delay=rate_limit_delay,
                 client=client,
             )
-            data = response.json()
+            data = load_wikidata(response.content)
             entities = data.get("entities", {})
 
             for qid, entity_data in entities.items():
@@ -303,32 +348,50 @@ async def async_resolve_qids_to_labels(
     qids: list[str],
     api_url: str,
     cache_dir: Path,
-    languages: Optional[list[str]] = None,
+    languages: Optional[Sequence[str]] = None,
     timeout: int = 60,
     rate_limit_delay: float = 0.0,
     headers: Optional[dict[str, str]] = None,
     client: Optional[AsyncClient] = None,
+    lang: str = "en",
 ) -> dict[str, str]:
     """
     Resolves a list of QIDs to their labels.
 
+    Labels resolved earlier in the run are served from an in-memory cache,
+    so only unseen QIDs are read from the entity cache or the API.
+
     Args:
         context: Dagster execution context for logging.
         qids: List of Wikidata QIDs to resolve.
         api_url: URL of the Wikidata Action API.
         cache_dir: Path to the local cache directory.
-        languages: Preferred languages for the labels.
+        languages: Fallback languages for the labels, in priority order.
         timeout: Request timeout in seconds. Defaults to 60.
         rate_limit_delay: Delay between requests in seconds. Defaults to 0.0.
         headers: Optional HTTP headers for the request.
         client: Async HTTP client to use for requests.
+        lang: Primary label language. Defaults to "en".
 
     Returns:
         Dictionary mapping QIDs to their resolved labels.
     """
+    fallback = tuple(languages or ())
+    labels: dict[str, str] = {}
+    missing: list[str] = []
+    for qid in qids:
+        label = _recall_label((qid, lang, fallback))
+        if label is not None:
+            labels[qid] = label
+        else:
+            missing.append(qid)
+
+    if not missing:
+        return labels
+
     entities = await async_fetch_wikidata_entities_batch(
         context,
-        qids,
+        missing,
         api_url=api_url,
         cache_dir=cache_dir,
         languages=languages,
@@ -337,10 +400,11 @@ async def async_resolve_qids_to_labels(
         headers=headers,
         client=client
     )
-    labels = {}
-    for qid, data in entities.items():
-        label = extract_wikidata_label(data, languages=languages)
+    resolved = extract_wikidata_labels_bulk(entities.values(), lang=lang, languages=languages)
+    for qid, label in zip(entities, resolved):
         if label:
+            # Only hits are cached, so a failed fetch is retried on the next call
+            _remember_label((qid, lang, fallback), label)
             labels[qid] = label
     return labels
 
@@ -348,7 +412,7 @@ async def async_resolve_qids_to_labels(
 def extract_wikidata_label(
     entity_data: dict[str, Any], 
     lang: str = "en", 
-    languages: Optional[list[str]] = None
+    languages: Optional[Sequence[str]] = None
 ) -> Optional[str]:
     """
     Extracts the label for a given language.
@@ -358,30 +422,65 @@ def extract_wikidata_label(
     Args:
         entity_data: Raw Wikidata entity dictionary.
         lang: Primary language to look for. Defaults to "en".
-        languages: List of fallback languages. Defaults to None.
+        languages: Fallback languages in priority order. Defaults to None.
 
     Returns:
         The extracted label, or None if not found.
     """
     labels = entity_data.get("labels") or {}
 
-    # 1. Try requested language
-    if lang in labels:
-        return labels[lang].get("value")
+    # 1. Try requested language (the common case: one dict lookup)
+    entry = labels.get(lang)
+    if entry:
+        return entry.get("value")
 
-    # 2. Try fallback languages
-    if languages:
-        for fallback in languages:
-            if fallback in labels:
-                return labels[fallback].get("value")
+    # 2. Try fallback languages in priority order
+    for fallback in languages or ():
+        if fallback == lang:
+            continue
+        entry = labels.get(fallback)
+        if entry:
+            return entry.get("value")
 
     return None
 
 
+def extract_wikidata_labels_bulk(
+    entities: Iterable[dict[str, Any]],
+    lang: str = "en",
+    languages: Optional[Sequence[str]] = None
+) -> list[Optional[str]]:
+    """
+    Extracts labels for many entities using the same language priority as extract_wikidata_label.
+
+    The priority order is computed once for the whole batch instead of per entity.
+
+    Args:
+        entities: Raw Wikidata entity dictionaries.
+        lang: Primary language to look for. Defaults to "en".
+        languages: Fallback languages in priority order. Defaults to None.
+
+    Returns:
+        One label (or None) per entity, in input order.
+    """
+    priority = (lang, *[fallback for fallback in languages or () if fallback != lang])
+    results: list[Optional[str]] = []
+    for entity_data in entities:
+        labels = entity_data.get("labels") or {}
+        value = None
+        for candidate in priority:
+            entry = labels.get(candidate)
+            if entry:
+                value = entry.get("value")
+                break
+        results.append(value)
+    return results
+
+
 def extract_wikidata_aliases(
     entity_data: dict[str, Any], 
     lang: str = "en",
-    languages: Optional[list[str]] = None
+    languages: Optional[Sequence[str]] = None
 ) -> list[str]:
     """
     Extracts aliases for a given language.
@@ -391,7 +490,7 @@ def extract_wikidata_aliases(
     Args:
         entity_data: Raw Wikidata entity dictionary.
         lang: Primary language to look for. Defaults to "en".
-        languages: List of fallback languages. Defaults to None.
+        languages: Fallback languages in priority order. Defaults to None.
 
     Returns:
         List of alias strings.
@@ -399,14 +498,17 @@ def extract_wikidata_aliases(
     all_aliases = entity_data.get("aliases") or {}
 
     # 1. Try requested language
-    if lang in all_aliases:
-        return [a["value"] for a in all_aliases[lang]]
-
-    # 2. Try fallback languages
-    if languages:
-        for fallback in languages:
-            if fallback in all_aliases:
-                return [a["value"] for a in all_aliases[fallback]]
+    entries = all_aliases.get(lang)
+    if entries is not None:
+        return [a["value"] for a in entries]
+
+    # 2. Try fallback languages in priority order
+    for fallback in languages or ():
+        if fallback == lang:
+            continue
+        entries = all_aliases.get(fallback)
+        if entries is not None:
+            return [a["value"] for a in entries]
 
     return []
 
@@ -578,7 +680,7 @@ async def async_resolve_labels_to_qids(
                 rate_limit_delay=rate_limit_delay,
                 client=client,
             )
-            data = response.json()
+            data = load_wikidata(response.content)
             search_results = data.get("search", [])
 
             if search_results:
@@ -20,7 +20,23 @@ from data_pipeline.utils.network_helpers import (
     AsyncClient,
     HTTPError,
 )
-from data_pipeline.utils.io_helpers import async_read_text_file, async_write_text_file
+from data_pipeline.utils.io_helpers import (
+    async_read_text_file,
+    async_write_text_file,
+    get_sharded_path,
+)
+
+# Translation table mapping underscores to spaces in article titles
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+# Query parameters shared by every article request; only "titles" varies per call
+_ARTICLE_QUERY_PARAMS = (
+    ("action", "query"),
+    ("format", "json"),
+    ("prop", "extracts"),
+    ("explaintext", "True"),
+    ("redirects", 1),
+)
 
 
 async def async_fetch_wikipedia_article(
@@ -36,7 +52,7 @@ async def async_fetch_wikipedia_article(
     """
     Fetches the raw plain text of a Wikipedia article by its title, with caching.
 
-    The QID is required to ensure consistent cache file naming (e.g., Q123.txt).
+    The QID is required to ensure consistent cache file naming (e.g., 123/Q123.txt).
 
     Args:
         context: Dagster execution context for logging.
@@ -51,10 +67,12 @@ async def async_fetch_wikipedia_article(
     Returns:
         The raw plain text of the article, or None if not found or on error.
     """
-    clean_title = urllib.parse.unquote(title).replace("_", " ")
+    # Most titles carry no percent-escapes, so skip unquoting unless needed
+    clean_title = urllib.parse.unquote(title) if "%" in title else title
+    clean_title = clean_title.translate(_UNDERSCORE_TO_SPACE)
     
-    # Use QID for cache filename
-    cache_file = cache_dir / f"{qid}.txt"
+    # Use QID for cache filename, sharded by QID suffix (e.g., 123/Q123.txt)
+    cache_file = get_sharded_path(cache_dir, qid, ".txt")
     
     # 1. Check Cache
     cached_content = await async_read_text_file(cache_file)
@@ -62,14 +80,7 @@ async def async_fetch_wikipedia_article(
         return cached_content
 
     # 2. Fetch from API
-    params = {
-        "action": "query",
-        "format": "json",
-        "titles": clean_title,
-        "prop": "extracts",
-        "explaintext": "True",
-        "redirects": 1,
-    }
+    params = _ARTICLE_QUERY_PARAMS + (("titles", clean_title),)
 
     try:
         response = await make_async_request_with_retries(
@@ -0,0 +1,23 @@
+# -----------------------------------------------------------
+# Shared Test Fixtures
+# Dagster Data pipeline for Structured and Unstructured Data
+#
+# (C) 2025-2026 Juan-Francisco Reyes, Cottbus, Germany
+# Released under MIT License
+# email pacoreyes@protonmail.com
+# -----------------------------------------------------------
+
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def mock_async_client():
+    """
+    Creates a mock async HTTP client shared by the whole test session.
+
+    Only exposes the methods the pipeline calls on the client. Tests must not
+    configure return values on it, since the same instance is reused.
+    """
+    return MagicMock(spec_set=["get", "post", "request", "close", "__aenter__", "__aexit__"])
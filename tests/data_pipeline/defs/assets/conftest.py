@@ -0,0 +1,54 @@
+# -----------------------------------------------------------
+# Shared Fixtures for Asset Tests
+# Dagster Data pipeline for Structured and Unstructured Data
+#
+# (C) 2025-2026 Juan-Francisco Reyes, Cottbus, Germany
+# Released under MIT License
+# email pacoreyes@protonmail.com
+# -----------------------------------------------------------
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def settings_mock():
+    """
+    Creates a mock of the pipeline settings used by the article extraction assets.
+
+    Built once per test module and patched into the asset module by each test.
+    """
+    mock_settings = MagicMock()
+    mock_settings.WIKIDATA_ACTION_BATCH_SIZE = 10
+    mock_settings.WIKIDATA_ACTION_REQUEST_TIMEOUT = 10
+    mock_settings.WIKIDATA_CONCURRENT_REQUESTS = 2
+    mock_settings.WIKIDATA_ACTION_RATE_LIMIT_DELAY = 0
+    mock_settings.WIKIPEDIA_CONCURRENT_REQUESTS = 2
+    mock_settings.WIKIPEDIA_RATE_LIMIT_DELAY = 0
+    mock_settings.WIKIDATA_ACTION_API_URL = "http://wd.api"
+    mock_settings.MIN_CONTENT_LENGTH = 10
+    mock_settings.ARTICLES_BUFFER_SIZE = 10
+    mock_settings.WIKIPEDIA_CACHE_DIRPATH = Path("/tmp/wiki_cache")
+    mock_settings.WIKIDATA_CACHE_DIRPATH = Path("/tmp/wd_cache")
+    mock_settings.DEFAULT_REQUEST_HEADERS = {"User-Agent": "test"}
+    mock_settings.DEFAULT_EMBEDDINGS_MODEL_NAME = "nomic-ai/nomic-embed-text-v1.5"
+    mock_settings.TEXT_CHUNK_SIZE = 100
+    mock_settings.TEXT_CHUNK_OVERLAP = 10
+    mock_settings.WIKIDATA_FALLBACK_LANGUAGES = ["en"]
+    mock_settings.WIKIDATA_CONCEPT_BASE_URI_PREFIX = "http://wd.entity/"
+    return mock_settings
+
+
+@pytest.fixture
+def mock_splitter_factory():
+    """
+    Creates a stand-in for create_rag_text_splitter, fresh for every test.
+
+    The factory never loads a Hugging Face tokenizer. Tests set the chunks they
+    need on `mock_splitter_factory.return_value.split_text.return_value`. The
+    factory is replaced instead of stubbing `transformers` in sys.modules, since
+    data_transformation_helpers imports it when the test modules are collected.
+    """
+    return MagicMock(return_value=MagicMock())
@@ -7,7 +7,7 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import patch, MagicMock
 import polars as pl
 from dagster import build_asset_context
@@ -15,22 +15,17 @@ from data_pipeline.defs.assets.build_artist_index import (
     build_artist_index_by_decade,
     build_artist_index,
 )
-from data_pipeline.utils.network_helpers import AsyncClient
 
-@pytest.mark.asyncio
 @patch("data_pipeline.defs.assets.build_artist_index.run_extraction_pipeline")
-async def test_build_artist_index_by_decade(mock_execute):
+async def test_build_artist_index_by_decade(mock_execute, mock_async_client):
     """Test the extraction asset for a specific decade."""
-    from contextlib import asynccontextmanager
-
     # Create a mock context with a partition key
     context = build_asset_context(partition_key="1960s")
-    mock_client = MagicMock(spec=AsyncClient)
 
     mock_wikidata = MagicMock()
     @asynccontextmanager
     async def mock_yield(context):
-        yield mock_client
+        yield mock_async_client
     mock_wikidata.get_client = mock_yield
 
     mock_execute.return_value = [{"artist_uri": "http://q1", "name": "Artist 1", "start_date": "1965"}]
@@ -45,7 +40,6 @@ async def test_build_artist_index_by_decade(mock_execute):
     assert df["name"][0] == "Artist 1"
 
 
-@pytest.mark.asyncio
 
 
 @patch("data_pipeline.defs.assets.build_artist_index.settings")
@@ -60,7 +54,10 @@ async def test_artist_index_merge_and_clean(
     mock_dedup,
 
 
-    mock_settings
+    mock_settings,
+
+
+    asset_ctx
 
 
 ):
@@ -72,7 +69,7 @@ async def test_artist_index_merge_and_clean(
     from dagster import MaterializeResult
 
 
-    from pathlib import Path
+    from pathlib import PurePosixPath
 
 
     
@@ -81,10 +78,10 @@ async def test_artist_index_merge_and_clean(
     # Mock Settings
 
 
-    mock_settings.TEMP_DIRPATH = MagicMock()
+    mock_settings.TEMP_DIRPATH = PurePosixPath("/tmp/t")
 
 
-    mock_settings.DATASETS_DIRPATH = MagicMock()
+    mock_settings.DATASETS_DIRPATH = PurePosixPath("/tmp/d")
 
 
     
@@ -120,7 +117,7 @@ async def test_artist_index_merge_and_clean(
 
 
 
-    context = build_asset_context()
+    context = asset_ctx
 
 
 
@@ -7,16 +7,15 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-import pytest
+from contextlib import asynccontextmanager
 import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import polars as pl
-from dagster import build_asset_context, MaterializeResult
+from dagster import MaterializeResult
 
 from data_pipeline.defs.assets.extract_artists import extract_artists, _is_latin_name
 from data_pipeline.defs.resources import LastFmResource
-from data_pipeline.utils.network_helpers import AsyncClient
 
 
 def test_is_latin_name():
@@ -39,7 +38,6 @@ def test_is_latin_name():
     assert _is_latin_name(None) is False
 
 
-@pytest.mark.asyncio
 
 
 @patch("data_pipeline.defs.assets.extract_artists.async_fetch_lastfm_data_with_cache")
@@ -69,6 +67,12 @@ async def test_extract_artist(
     mock_lastfm,
 
 
+    mock_async_client,
+
+
+    asset_ctx,
+
+
 ):
 
 
@@ -219,8 +223,6 @@ async def test_extract_artist(
 
 
 
-    from contextlib import asynccontextmanager
-
 
 
 
@@ -231,10 +233,9 @@ async def test_extract_artist(
     lastfm = LastFmResource(api_key="dummy_key")
 
 
-    context = build_asset_context()
+    context = asset_ctx
 
 
-    mock_client = MagicMock(spec=AsyncClient)
 
 
 
@@ -249,7 +250,7 @@ async def test_extract_artist(
     async def mock_yield(context):
 
 
-        yield mock_client
+        yield mock_async_client
 
 
         mock_wikidata.get_client = mock_yield
@@ -7,48 +7,29 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-import pytest
-from pathlib import Path
+from contextlib import asynccontextmanager
 from unittest.mock import MagicMock, patch, AsyncMock
 import polars as pl
-from dagster import build_asset_context
 
 from data_pipeline.defs.assets.extract_artists_articles import extract_artist_articles
-from data_pipeline.utils.network_helpers import AsyncClient
 
 
-@pytest.mark.asyncio
-@patch("data_pipeline.defs.assets.extract_artists_articles.settings")
 async def test_extract_artists_articles_flow(
-    mock_settings
+    settings_mock, mock_async_client, mock_splitter_factory, mocker, asset_ctx
 ):
-    # Setup Mocks
-    mock_settings.WIKIDATA_ACTION_BATCH_SIZE = 10
-    mock_settings.WIKIDATA_ACTION_REQUEST_TIMEOUT = 10
-    mock_settings.WIKIDATA_CONCURRENT_REQUESTS = 2
-    mock_settings.WIKIDATA_ACTION_RATE_LIMIT_DELAY = 0
-    mock_settings.WIKIPEDIA_CONCURRENT_REQUESTS = 2
-    mock_settings.WIKIPEDIA_RATE_LIMIT_DELAY = 0
-    mock_settings.WIKIDATA_ACTION_API_URL = "http://wd.api"
-    mock_settings.MIN_CONTENT_LENGTH = 10
-    mock_settings.ARTICLES_BUFFER_SIZE = 10
-    mock_settings.WIKIPEDIA_CACHE_DIRPATH = Path("/tmp/wiki_cache")
-    mock_settings.DEFAULT_REQUEST_HEADERS = {"User-Agent": "test"}
-    mock_settings.DEFAULT_EMBEDDINGS_MODEL_NAME = "nomic-ai/nomic-embed-text-v1.5"
-    mock_settings.TEXT_CHUNK_SIZE = 100
-    mock_settings.TEXT_CHUNK_OVERLAP = 10
-    mock_settings.WIKIDATA_FALLBACK_LANGUAGES = ["en"]
-    mock_settings.WIKIDATA_CONCEPT_BASE_URI_PREFIX = "http://wd.entity/"
+    mocker.patch(
+        "data_pipeline.defs.assets.extract_artists_articles.settings", new=settings_mock
+    )
 
     # Mock Data DataFrames (Input)
-    artists_df = pl.DataFrame([
+    artists_df = pl.LazyFrame([
         {"id": "Q1", "name": "Artist One", "genres": ["QG1"]},
         {"id": "Q2", "name": "Artist Two", "genres": []}
     ])
-    genres_df = pl.DataFrame([
+    genres_df = pl.LazyFrame([
         {"id": "QG1", "name": "Rock"}
     ])
-    index_df = pl.DataFrame([
+    index_df = pl.LazyFrame([
         {"artist_uri": "http://www.wikidata.org/entity/Q1", "start_date": "1991-01-01"}
     ])
 
@@ -64,30 +45,29 @@ async def test_extract_artists_articles_flow(
         return result
 
     # Mock Dependencies
-    with patch("data_pipeline.defs.assets.extract_artists_articles.async_fetch_wikipedia_article", new_callable=AsyncMock) as mock_fetch, \
-         patch("data_pipeline.defs.assets.extract_artists_articles.async_fetch_wikidata_entities_batch", side_effect=mock_fetch_entities), \
-         patch("data_pipeline.defs.assets.extract_artists_articles.create_rag_text_splitter") as mock_splitter_factory:
-
-        mock_fetch.return_value = "This is a sufficiently long text for Artist One to ensure it passes the minimal content filter of 50 characters."
-        mock_splitter_instance = MagicMock()
-        mock_splitter_instance.split_text.return_value = ["Chunk 1", "Chunk 2"]
-        mock_splitter_factory.return_value = mock_splitter_instance
-
-        from contextlib import asynccontextmanager
-
-        context = build_asset_context()
-        mock_client = MagicMock(spec=AsyncClient)
+    mock_fetch = AsyncMock(
+        return_value="This is a sufficiently long text for Artist One to ensure it passes the minimal content filter of 50 characters."
+    )
+    mock_splitter_factory.return_value.split_text.return_value = ["Chunk 1", "Chunk 2"]
+
+    patches = {
+        "async_fetch_wikipedia_article": mock_fetch,
+        "async_fetch_wikidata_entities_batch": AsyncMock(side_effect=mock_fetch_entities),
+        "create_rag_text_splitter": mock_splitter_factory,
+    }
+    with patch.multiple("data_pipeline.defs.assets.extract_artists_articles", **patches):
+        context = asset_ctx
 
         mock_wikidata = MagicMock()
         @asynccontextmanager
         async def mock_yield_wd(context):
-            yield mock_client
+            yield mock_async_client
         mock_wikidata.get_client = mock_yield_wd
 
         mock_wikipedia = MagicMock()
         @asynccontextmanager
         async def mock_yield_wp(context):
-            yield mock_client
+            yield mock_async_client
         mock_wikipedia.get_client = mock_yield_wp
         mock_wikipedia.api_url = "http://wp.api"
         mock_wikipedia.rate_limit_delay = 0
@@ -97,9 +77,9 @@ async def test_extract_artists_articles_flow(
             context,
             mock_wikidata,
             mock_wikipedia,
-            artists_df.lazy(),
-            genres_df.lazy(),
-            index_df.lazy()
+            artists_df,
+            genres_df,
+            index_df
         )
 
         assert isinstance(results, list)
@@ -110,38 +90,22 @@ async def test_extract_artists_articles_flow(
         assert first_batch[0].metadata.entity_type == "artist"
 
 
-@pytest.mark.asyncio
-@patch("data_pipeline.defs.assets.extract_artists_articles.settings")
 async def test_extract_artists_articles_deduplication(
-    mock_settings
+    settings_mock, mock_async_client, mock_splitter_factory, mocker, asset_ctx
 ):
-    # Setup Mocks
-    mock_settings.WIKIDATA_ACTION_BATCH_SIZE = 10
-    mock_settings.WIKIDATA_ACTION_REQUEST_TIMEOUT = 10
-    mock_settings.WIKIDATA_CONCURRENT_REQUESTS = 2
-    mock_settings.WIKIDATA_ACTION_RATE_LIMIT_DELAY = 0
-    mock_settings.WIKIPEDIA_CONCURRENT_REQUESTS = 2
-    mock_settings.WIKIPEDIA_RATE_LIMIT_DELAY = 0
-    mock_settings.WIKIDATA_ACTION_API_URL = "http://wd.api"
-    mock_settings.MIN_CONTENT_LENGTH = 10
-    mock_settings.ARTICLES_BUFFER_SIZE = 10
-    mock_settings.WIKIPEDIA_CACHE_DIRPATH = Path("/tmp/wiki_cache")
-    mock_settings.DEFAULT_REQUEST_HEADERS = {"User-Agent": "test"}
-    mock_settings.DEFAULT_EMBEDDINGS_MODEL_NAME = "nomic-ai/nomic-embed-text-v1.5"
-    mock_settings.TEXT_CHUNK_SIZE = 100
-    mock_settings.TEXT_CHUNK_OVERLAP = 10
-    mock_settings.WIKIDATA_FALLBACK_LANGUAGES = ["en"]
-    mock_settings.WIKIDATA_CONCEPT_BASE_URI_PREFIX = "http://wd.entity/"
+    mocker.patch(
+        "data_pipeline.defs.assets.extract_artists_articles.settings", new=settings_mock
+    )
 
     # Mock Data DataFrames (Input) - DUPLICATES!
-    artists_df = pl.DataFrame([
+    artists_df = pl.LazyFrame([
         {"id": "Q1", "name": "Artist One", "genres": ["QG1"]},
         {"id": "Q1", "name": "Artist One", "genres": ["QG1"]}
     ])
-    genres_df = pl.DataFrame([
+    genres_df = pl.LazyFrame([
         {"id": "QG1", "name": "Rock"}
     ])
-    index_df = pl.DataFrame([
+    index_df = pl.LazyFrame([
         {"artist_uri": "http://www.wikidata.org/entity/Q1", "start_date": "1991-01-01"}
     ])
 
@@ -155,43 +119,43 @@ async def test_extract_artists_articles_deduplication(
         return result
 
     # Mock Dependencies
-    with patch("data_pipeline.defs.assets.extract_artists_articles.async_fetch_wikipedia_article", new_callable=AsyncMock) as mock_fetch, \
-         patch("data_pipeline.defs.assets.extract_artists_articles.async_fetch_wikidata_entities_batch", side_effect=mock_fetch_entities), \
-         patch("data_pipeline.defs.assets.extract_artists_articles.create_rag_text_splitter") as mock_splitter_factory:
-
-        mock_fetch.return_value = "This is a sufficiently long text for Artist One to ensure it passes the minimal content filter of 50 characters."
-        mock_splitter_instance = MagicMock()
-        mock_splitter_instance.split_text.return_value = ["Chunk 1"]
-        mock_splitter_factory.return_value = mock_splitter_instance
-
-        from contextlib import asynccontextmanager
-
-        context = build_asset_context()
-        mock_client = MagicMock(spec=AsyncClient)
+    mock_fetch = AsyncMock(
+        return_value="This is a sufficiently long text for Artist One to ensure it passes the minimal content filter of 50 characters."
+    )
+    mock_splitter_factory.return_value.split_text.return_value = ["Chunk 1"]
+
+    patches = {
+        "async_fetch_wikipedia_article": mock_fetch,
+        "async_fetch_wikidata_entities_batch": AsyncMock(side_effect=mock_fetch_entities),
+        "create_rag_text_splitter": mock_splitter_factory,
+    }
+    with patch.multiple("data_pipeline.defs.assets.extract_artists_articles", **patches):
+        context = asset_ctx
 
         mock_wikidata = MagicMock()
         @asynccontextmanager
         async def mock_yield_wd(context):
-            yield mock_client
+            yield mock_async_client
         mock_wikidata.get_client = mock_yield_wd
 
         mock_wikipedia = MagicMock()
         @asynccontextmanager
         async def mock_yield_wp(context):
-            yield mock_client
+            yield mock_async_client
         mock_wikipedia.get_client = mock_yield_wp
         mock_wikipedia.api_url = "http://wp.api"
         mock_wikipedia.rate_limit_delay = 0
 
-        # Run Asset
-        results = await extract_artist_articles(
-            context,
-            mock_wikidata,
-            mock_wikipedia,
-            artists_df.lazy(),
-            genres_df.lazy(),
-            index_df.lazy()
-        )
+        # Run Asset with one-row streaming chunks so duplicates span chunk boundaries
+        with pl.Config(streaming_chunk_size=1):
+            results = await extract_artist_articles(
+                context,
+                mock_wikidata,
+                mock_wikipedia,
+                artists_df,
+                genres_df,
+                index_df
+            )
 
         assert isinstance(results, list)
         # Should contain only 1 chunk for Q1, despite 2 rows in input
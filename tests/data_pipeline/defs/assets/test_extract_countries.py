@@ -7,20 +7,18 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import patch, MagicMock
 import polars as pl
-from dagster import build_asset_context
 
 from data_pipeline.defs.assets.extract_countries import extract_countries
 from data_pipeline.models import Country
 
 
-@pytest.mark.asyncio
 @patch("data_pipeline.defs.assets.extract_countries.extract_wikidata_aliases")
 @patch("data_pipeline.defs.assets.extract_countries.async_fetch_wikidata_entities_batch")
 @patch("data_pipeline.defs.assets.extract_countries.async_resolve_labels_to_qids")
-async def test_extract_countries(mock_resolve, mock_fetch_entities, mock_extract_aliases):
+async def test_extract_countries(mock_resolve, mock_fetch_entities, mock_extract_aliases, asset_ctx):
     """
     Test the extract_countries asset.
     """
@@ -58,7 +56,6 @@ async def test_extract_countries(mock_resolve, mock_fetch_entities, mock_extract
     mock_extract_aliases.side_effect = side_effect
 
     # Mock Resource
-    from contextlib import asynccontextmanager
     mock_client = MagicMock()
     mock_wikidata = MagicMock()
     
@@ -74,7 +71,7 @@ async def test_extract_countries(mock_resolve, mock_fetch_entities, mock_extract
     
     mock_wikidata.get_client = mock_get_client
 
-    context = build_asset_context()
+    context = asset_ctx
     
     # Execution
     result = await extract_countries(context, mock_wikidata, artists_lf)
@@ -7,22 +7,21 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-import pytest
+from contextlib import asynccontextmanager
 import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import polars as pl
-from dagster import build_asset_context, MaterializeResult
+from dagster import MaterializeResult
 
 from data_pipeline.defs.assets.extract_genres import extract_genres
-from data_pipeline.utils.network_helpers import AsyncClient
 
-@pytest.mark.asyncio
 @patch("data_pipeline.defs.assets.extract_genres.async_fetch_wikidata_entities_batch")
 @patch("data_pipeline.defs.assets.extract_genres.settings")
 async def test_extract_genres(
     mock_settings,
-    mock_fetch_entities
+    mock_fetch_entities,
+    mock_async_client, asset_ctx
 ):
     """
     Test the genres asset.
@@ -44,16 +43,13 @@ async def test_extract_genres(
 
     # Unique Genres Expected: Q101, Q102, Q103, Q104
 
-    from contextlib import asynccontextmanager
-
     # Mock Context and Resource
-    context = build_asset_context()
-    mock_client = MagicMock(spec=AsyncClient)
+    context = asset_ctx
 
     mock_wikidata = MagicMock()
     @asynccontextmanager
     async def mock_yield(context):
-        yield mock_client
+        yield mock_async_client
     mock_wikidata.get_client = mock_yield
 
     # Configure for batching test
@@ -7,41 +7,22 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-import pytest
-from pathlib import Path
+from contextlib import asynccontextmanager
 from unittest.mock import MagicMock, patch, AsyncMock
 import polars as pl
-from dagster import build_asset_context
 
 from data_pipeline.defs.assets.extract_genres_articles import extract_genres_articles
-from data_pipeline.utils.network_helpers import AsyncClient
 
 
-@pytest.mark.asyncio
-@patch("data_pipeline.defs.assets.extract_genres_articles.settings")
 async def test_extract_genres_articles_flow(
-    mock_settings
+    settings_mock, mock_async_client, mock_splitter_factory, mocker, asset_ctx
 ):
-    # Setup Mocks
-    mock_settings.WIKIDATA_ACTION_BATCH_SIZE = 10
-    mock_settings.WIKIDATA_ACTION_REQUEST_TIMEOUT = 10
-    mock_settings.WIKIDATA_CONCURRENT_REQUESTS = 2
-    mock_settings.WIKIDATA_ACTION_RATE_LIMIT_DELAY = 0
-    mock_settings.WIKIPEDIA_CONCURRENT_REQUESTS = 2
-    mock_settings.WIKIPEDIA_RATE_LIMIT_DELAY = 0
-    mock_settings.WIKIDATA_ACTION_API_URL = "http://wd.api"
-    mock_settings.MIN_CONTENT_LENGTH = 10
-    mock_settings.WIKIPEDIA_CACHE_DIRPATH = Path("/tmp/wiki_cache")
-    mock_settings.WIKIDATA_CACHE_DIRPATH = Path("/tmp/wd_cache")
-    mock_settings.DEFAULT_REQUEST_HEADERS = {"User-Agent": "test"}
-    mock_settings.DEFAULT_EMBEDDINGS_MODEL_NAME = "nomic-ai/nomic-embed-text-v1.5"
-    mock_settings.TEXT_CHUNK_SIZE = 100
-    mock_settings.TEXT_CHUNK_OVERLAP = 10
-    mock_settings.WIKIDATA_FALLBACK_LANGUAGES = ["en"]
-    mock_settings.WIKIDATA_CONCEPT_BASE_URI_PREFIX = "http://wd.entity/"
+    mocker.patch(
+        "data_pipeline.defs.assets.extract_genres_articles.settings", new=settings_mock
+    )
 
     # Mock Data DataFrames (Input)
-    genres_df = pl.DataFrame([
+    genres_df = pl.LazyFrame([
         {"id": "Q1298934", "name": "Techno", "aliases": ["techno music", "Detroit techno"]},
         {"id": "Q11401", "name": "House", "aliases": ["house music"]}
     ])
@@ -88,31 +69,30 @@ async def test_extract_genres_articles_flow(
         return result
 
     # Mock Dependencies
-    with patch("data_pipeline.defs.assets.extract_genres_articles.async_fetch_wikipedia_article", new_callable=AsyncMock) as mock_fetch, \
-         patch("data_pipeline.defs.assets.extract_genres_articles.async_fetch_wikidata_entities_batch", side_effect=mock_fetch_entities), \
-         patch("data_pipeline.defs.assets.extract_genres_articles.async_resolve_qids_to_labels", side_effect=mock_resolve_labels), \
-         patch("data_pipeline.defs.assets.extract_genres_articles.create_rag_text_splitter") as mock_splitter_factory:
-
-        mock_fetch.return_value = "This is a sufficiently long text for Techno genre to ensure it passes the minimal content filter of 50 characters."
-        mock_splitter_instance = MagicMock()
-        mock_splitter_instance.split_text.return_value = ["Chunk 1", "Chunk 2"]
-        mock_splitter_factory.return_value = mock_splitter_instance
-
-        from contextlib import asynccontextmanager
+    mock_fetch = AsyncMock(
+        return_value="This is a sufficiently long text for Techno genre to ensure it passes the minimal content filter of 50 characters."
+    )
+    mock_splitter_factory.return_value.split_text.return_value = ["Chunk 1", "Chunk 2"]
 
-        context = build_asset_context()
-        mock_client = MagicMock(spec=AsyncClient)
+    patches = {
+        "async_fetch_wikipedia_article": mock_fetch,
+        "async_fetch_wikidata_entities_batch": AsyncMock(side_effect=mock_fetch_entities),
+        "async_resolve_qids_to_labels": AsyncMock(side_effect=mock_resolve_labels),
+        "create_rag_text_splitter": mock_splitter_factory,
+    }
+    with patch.multiple("data_pipeline.defs.assets.extract_genres_articles", **patches):
+        context = asset_ctx
 
         mock_wikidata = MagicMock()
         @asynccontextmanager
         async def mock_yield_wd(context):
-            yield mock_client
+            yield mock_async_client
         mock_wikidata.get_client = mock_yield_wd
 
         mock_wikipedia = MagicMock()
         @asynccontextmanager
         async def mock_yield_wp(context):
-            yield mock_client
+            yield mock_async_client
         mock_wikipedia.get_client = mock_yield_wp
         mock_wikipedia.api_url = "http://wp.api"
         mock_wikipedia.rate_limit_delay = 0
@@ -122,7 +102,7 @@ async def test_extract_genres_articles_flow(
             context,
             mock_wikidata,
             mock_wikipedia,
-            genres_df.lazy()
+            genres_df
         )
 
         assert isinstance(results, list)
@@ -144,35 +124,28 @@ async def test_extract_genres_articles_flow(
         assert first_article.metadata.aliases == ["techno music", "Detroit techno"]
 
 
-@pytest.mark.asyncio
-@patch("data_pipeline.defs.assets.extract_genres_articles.settings")
 async def test_extract_genres_articles_empty_input(
-    mock_settings
+    settings_mock, mock_async_client, mocker, asset_ctx
 ):
-    # Setup Mocks
-    mock_settings.WIKIDATA_ACTION_BATCH_SIZE = 10
-    mock_settings.DEFAULT_EMBEDDINGS_MODEL_NAME = "nomic-ai/nomic-embed-text-v1.5"
-    mock_settings.TEXT_CHUNK_SIZE = 100
-    mock_settings.TEXT_CHUNK_OVERLAP = 10
+    mocker.patch(
+        "data_pipeline.defs.assets.extract_genres_articles.settings", new=settings_mock
+    )
 
     # Empty genres DataFrame
-    genres_df = pl.DataFrame({"id": [], "name": [], "aliases": []})
+    genres_df = pl.LazyFrame({"id": [], "name": [], "aliases": []})
 
-    from contextlib import asynccontextmanager
-
-    context = build_asset_context()
-    mock_client = MagicMock(spec=AsyncClient)
+    context = asset_ctx
 
     mock_wikidata = MagicMock()
     @asynccontextmanager
     async def mock_yield_wd(context):
-        yield mock_client
+        yield mock_async_client
     mock_wikidata.get_client = mock_yield_wd
 
     mock_wikipedia = MagicMock()
     @asynccontextmanager
     async def mock_yield_wp(context):
-        yield mock_client
+        yield mock_async_client
     mock_wikipedia.get_client = mock_yield_wp
     mock_wikipedia.api_url = "http://wp.api"
     mock_wikipedia.rate_limit_delay = 0
@@ -182,34 +155,22 @@ async def test_extract_genres_articles_empty_input(
         context,
         mock_wikidata,
         mock_wikipedia,
-        genres_df.lazy()
+        genres_df
     )
 
     assert isinstance(results, list)
     assert len(results) == 0
 
 
-@pytest.mark.asyncio
-@patch("data_pipeline.defs.assets.extract_genres_articles.settings")
 async def test_extract_genres_articles_no_wikipedia_url(
-    mock_settings
+    settings_mock, mock_async_client, mock_splitter_factory, mocker, asset_ctx
 ):
-    # Setup Mocks
-    mock_settings.WIKIDATA_ACTION_BATCH_SIZE = 10
-    mock_settings.WIKIDATA_ACTION_REQUEST_TIMEOUT = 10
-    mock_settings.WIKIDATA_CONCURRENT_REQUESTS = 2
-    mock_settings.WIKIDATA_ACTION_RATE_LIMIT_DELAY = 0
-    mock_settings.WIKIPEDIA_CONCURRENT_REQUESTS = 2
-    mock_settings.WIKIDATA_ACTION_API_URL = "http://wd.api"
-    mock_settings.WIKIDATA_CACHE_DIRPATH = Path("/tmp/wd_cache")
-    mock_settings.DEFAULT_REQUEST_HEADERS = {"User-Agent": "test"}
-    mock_settings.DEFAULT_EMBEDDINGS_MODEL_NAME = "nomic-ai/nomic-embed-text-v1.5"
-    mock_settings.TEXT_CHUNK_SIZE = 100
-    mock_settings.TEXT_CHUNK_OVERLAP = 10
-    mock_settings.WIKIDATA_FALLBACK_LANGUAGES = ["en"]
+    mocker.patch(
+        "data_pipeline.defs.assets.extract_genres_articles.settings", new=settings_mock
+    )
 
     # Genre without Wikipedia article
-    genres_df = pl.DataFrame([
+    genres_df = pl.LazyFrame([
         {"id": "Q999999", "name": "Unknown Genre", "aliases": []}
     ])
 
@@ -217,24 +178,23 @@ async def test_extract_genres_articles_no_wikipedia_url(
     async def mock_fetch_entities(context, qids, client=None, **kwargs):
         return {"Q999999": {"claims": {}}}  # No sitelinks
 
-    with patch("data_pipeline.defs.assets.extract_genres_articles.async_fetch_wikidata_entities_batch", side_effect=mock_fetch_entities), \
-         patch("data_pipeline.defs.assets.extract_genres_articles.create_rag_text_splitter"):
-
-        from contextlib import asynccontextmanager
-
-        context = build_asset_context()
-        mock_client = MagicMock(spec=AsyncClient)
+    patches = {
+        "async_fetch_wikidata_entities_batch": AsyncMock(side_effect=mock_fetch_entities),
+        "create_rag_text_splitter": mock_splitter_factory,
+    }
+    with patch.multiple("data_pipeline.defs.assets.extract_genres_articles", **patches):
+        context = asset_ctx
 
         mock_wikidata = MagicMock()
         @asynccontextmanager
         async def mock_yield_wd(context):
-            yield mock_client
+            yield mock_async_client
         mock_wikidata.get_client = mock_yield_wd
 
         mock_wikipedia = MagicMock()
         @asynccontextmanager
         async def mock_yield_wp(context):
-            yield mock_client
+            yield mock_async_client
         mock_wikipedia.get_client = mock_yield_wp
         mock_wikipedia.api_url = "http://wp.api"
         mock_wikipedia.rate_limit_delay = 0
@@ -244,7 +204,7 @@ async def test_extract_genres_articles_no_wikipedia_url(
             context,
             mock_wikidata,
             mock_wikipedia,
-            genres_df.lazy()
+            genres_df
         )
 
         # Should return empty because genre has no Wikipedia URL
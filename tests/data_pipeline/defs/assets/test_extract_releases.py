@@ -1,11 +1,15 @@
 import pytest
+from contextlib import asynccontextmanager
 import polars as pl
 from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch
-from dagster import AssetExecutionContext, build_asset_context, MaterializeResult
+from dagster import AssetExecutionContext, MaterializeResult
 
 from data_pipeline.defs.assets.extract_releases import extract_releases
 
+# Explicit input schema so Polars skips type inference when building frames
+ARTISTS_SCHEMA = {"id": pl.Utf8, "mbid": pl.Utf8, "name": pl.Utf8}
+
 # Mock the helper function to avoid network calls
 @pytest.fixture
 def mock_fetch_release_groups(mocker):
@@ -14,10 +18,9 @@ def mock_fetch_release_groups(mocker):
         new_callable=AsyncMock
     )
 
-@pytest.mark.asyncio
 @patch("data_pipeline.defs.assets.extract_releases.settings")
 async def test_extract_releases_success(
-    mock_settings, mock_fetch_release_groups
+    mock_settings, mock_fetch_release_groups, asset_ctx
 ):
     """
     Test that extract_releases correctly processes artists and extracts releases.
@@ -28,11 +31,11 @@ async def test_extract_releases_success(
     mock_settings.MUSICBRAINZ_API_URL = "http://mb.api"
     
     # 1. Setup Input Data
-    artists_df = pl.DataFrame({
+    artists_df = pl.LazyFrame({
         "id": ["Q123"],
         "mbid": ["mbid-123"],
         "name": ["Test Artist"]
-    }).lazy()
+    }, schema=ARTISTS_SCHEMA)
 
     # 2. Setup Mock Return Value
     mock_fetch_release_groups.return_value = [
@@ -44,10 +47,8 @@ async def test_extract_releases_success(
         }
     ]
 
-    from contextlib import asynccontextmanager
-
     # 3. Create Context & Resource
-    context = build_asset_context()
+    context = asset_ctx
     mock_musicbrainz = MagicMock()
     @asynccontextmanager
     async def mock_yield(context):
@@ -65,15 +66,14 @@ async def test_extract_releases_success(
     assert results[0].id == "rel-1"
     assert results[0].artist_id == "Q123"
 
-@pytest.mark.asyncio
 @patch("data_pipeline.defs.assets.extract_releases.settings")
-async def test_extract_releases_empty_input(mock_settings, mock_fetch_release_groups):
+async def test_extract_releases_empty_input(mock_settings, mock_fetch_release_groups, asset_ctx):
     """
     Test handling of empty input dataframe.
     """
-    artists_df = pl.DataFrame(schema={"id": pl.Utf8, "mbid": pl.Utf8, "name": pl.Utf8}).lazy()
+    artists_df = pl.LazyFrame(schema=ARTISTS_SCHEMA)
 
-    context = build_asset_context()
+    context = asset_ctx
     mock_musicbrainz = MagicMock()
     
     results = await extract_releases(context, mock_musicbrainz, artists_df)
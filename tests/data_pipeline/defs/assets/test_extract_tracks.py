@@ -2,33 +2,39 @@ import pytest
 import polars as pl
 from unittest.mock import MagicMock, AsyncMock
 from contextlib import asynccontextmanager
-from dagster import build_asset_context
 
 from data_pipeline.defs.assets.extract_tracks import extract_tracks
 from data_pipeline.models import Track
 
+# Explicit input schema so Polars skips type inference when building frames
+RELEASES_SCHEMA = {"id": pl.Utf8, "title": pl.Utf8}
+
 
 @pytest.fixture
-def mock_fetch_releases(mocker):
-    return mocker.patch(
-        "data_pipeline.defs.assets.extract_tracks.fetch_releases_for_group_async",
-        new_callable=AsyncMock
+def mock_fetch_releases(monkeypatch):
+    mock = AsyncMock()
+    monkeypatch.setattr(
+        "data_pipeline.defs.assets.extract_tracks.fetch_releases_for_group_async", mock
     )
+    return mock
 
 
 @pytest.fixture
-def mock_fetch_tracks(mocker):
-    return mocker.patch(
-        "data_pipeline.defs.assets.extract_tracks.fetch_tracks_for_release_async",
-        new_callable=AsyncMock
+def mock_fetch_tracks(monkeypatch):
+    mock = AsyncMock()
+    monkeypatch.setattr(
+        "data_pipeline.defs.assets.extract_tracks.fetch_tracks_for_release_async", mock
     )
+    return mock
 
 
 @pytest.fixture
-def mock_select_best_release(mocker):
-    return mocker.patch(
-        "data_pipeline.defs.assets.extract_tracks.select_best_release"
+def mock_select_best_release(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(
+        "data_pipeline.defs.assets.extract_tracks.select_best_release", mock
     )
+    return mock
 
 
 @pytest.fixture
@@ -47,18 +53,17 @@ def mock_musicbrainz():
     return mock_resource
 
 
-@pytest.mark.asyncio
 async def test_extract_tracks_success(
-    mock_fetch_releases, mock_fetch_tracks, mock_select_best_release, mock_musicbrainz
+    mock_fetch_releases, mock_fetch_tracks, mock_select_best_release, mock_musicbrainz, asset_ctx
 ):
     """
     Test that extract_tracks returns a list of Track objects.
     """
     # 1. Setup Input Data (1 row needed)
-    releases_df = pl.DataFrame({
+    releases_df = pl.LazyFrame({
         "id": ["rg-123"],
         "title": ["Test Album"]
-    }).lazy()
+    }, schema=RELEASES_SCHEMA)
 
     # 2. Setup Mock Return Values
     mock_fetch_releases.return_value = [
@@ -73,7 +78,7 @@ async def test_extract_tracks_success(
     ]
 
     # 3. Create Context & Run Asset
-    context = build_asset_context()
+    context = asset_ctx
     results = await extract_tracks(context, mock_musicbrainz, releases_df)
 
     # 4. Verify return type is list
@@ -90,16 +95,15 @@ async def test_extract_tracks_success(
     assert results[1].album_id == "rg-123"
 
 
-@pytest.mark.asyncio
 async def test_extract_tracks_empty_input(
-    mock_fetch_releases, mock_fetch_tracks, mock_select_best_release, mock_musicbrainz
+    mock_fetch_releases, mock_fetch_tracks, mock_select_best_release, mock_musicbrainz, asset_ctx
 ):
     """
     Test handling of empty input dataframe returns empty list.
     """
-    releases_df = pl.DataFrame(schema={"id": pl.Utf8, "title": pl.Utf8}).lazy()
+    releases_df = pl.LazyFrame(schema=RELEASES_SCHEMA)
 
-    context = build_asset_context()
+    context = asset_ctx
     results = await extract_tracks(context, mock_musicbrainz, releases_df)
 
     # Verify empty list
@@ -110,22 +114,21 @@ async def test_extract_tracks_empty_input(
     mock_fetch_tracks.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_extract_tracks_no_best_release(
-    mock_fetch_releases, mock_fetch_tracks, mock_select_best_release, mock_musicbrainz
+    mock_fetch_releases, mock_fetch_tracks, mock_select_best_release, mock_musicbrainz, asset_ctx
 ):
     """
     Test that releases without a best release are skipped (no tracks returned).
     """
-    releases_df = pl.DataFrame({
+    releases_df = pl.LazyFrame({
         "id": ["rg-456"],
         "title": ["Album Without Tracks"]
-    }).lazy()
+    }, schema=RELEASES_SCHEMA)
 
     mock_fetch_releases.return_value = []
     mock_select_best_release.return_value = None
 
-    context = build_asset_context()
+    context = asset_ctx
     results = await extract_tracks(context, mock_musicbrainz, releases_df)
 
     # No tracks returned when best release not found
@@ -1,11 +1,11 @@
 import pytest
 from unittest.mock import MagicMock
 import polars as pl
-from dagster import build_asset_context
 from contextlib import contextmanager
 
 from data_pipeline.defs.assets.ingest_graph_db import ingest_graph_db
 from data_pipeline.defs.resources import Neo4jResource
+from data_pipeline.utils.neo4j_driver import close_thread_sessions
 
 # Global mock storage to bridge between fixture and class
 _MOCK_DRIVER = None
@@ -27,8 +27,10 @@ def mock_neo4j_resource():
     # Instantiate the subclass
     resource = MockNeo4jResource(uri="bolt://localhost:7687", username="neo4j", password="password")
     
-    # Setup session
-    mock_driver.session.return_value.__enter__.return_value = mock_session
+    # Setup session: used both as a context manager and as the thread's cached session
+    mock_driver.session.return_value = mock_session
+    mock_session.__enter__.return_value = mock_session
+    mock_session.closed.return_value = False
     mock_driver.verify_connectivity.return_value = None
     
     # FIX: Setup default return values to prevent infinite loops in clear_database
@@ -41,14 +43,19 @@ def mock_neo4j_resource():
     mock_result.consume.return_value = None
     
     mock_session.run.return_value = mock_result
+    # Managed transactions run their work function against the same session mock
+    mock_session.execute_write.side_effect = (
+        lambda work, *args, **kwargs: work(mock_session, *args, **kwargs)
+    )
     
     # Return tuple: (resource_instance, mock_driver, mock_session)
     yield resource, mock_driver, mock_session
     
     # Cleanup
+    close_thread_sessions()
     _MOCK_DRIVER = None
 
-def test_ingest_graph_db_executes_plays_genre_query(mock_neo4j_resource):
+def test_ingest_graph_db_executes_plays_genre_query(mock_neo4j_resource, asset_ctx):
     resource, mock_driver, mock_session = mock_neo4j_resource
 
     # Create dummy input data
@@ -58,7 +65,7 @@ def test_ingest_graph_db_executes_plays_genre_query(mock_neo4j_resource):
     genres_lf = pl.LazyFrame({"id": ["G1"], "name": ["Rock"], "aliases": [["Hard Rock"]], "parent_ids": [None]})
     countries_lf = pl.LazyFrame({"id": ["Q30"], "name": ["US"]})
 
-    context = build_asset_context()
+    context = asset_ctx
 
     # Run the asset
     result = ingest_graph_db(context, resource, artists_lf, releases_lf, tracks_lf, genres_lf, countries_lf)
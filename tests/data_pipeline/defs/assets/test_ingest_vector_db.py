@@ -12,7 +12,7 @@ from unittest.mock import MagicMock, patch
 
 import polars as pl
 import pytest
-from dagster import build_asset_context, MaterializeResult
+from dagster import MaterializeResult
 
 from data_pipeline.defs.assets.ingest_vector_db import (
     _prepare_chroma_metadata,
@@ -190,6 +190,7 @@ class TestIngestVectorDbAsset:
         mock_get_device,
         mock_embedding_class,
         mock_chromadb_resource,
+        asset_ctx,
     ):
         """Test successful ingestion of documents."""
         mock_get_device.return_value = MagicMock(__str__=lambda self: "cpu")
@@ -230,7 +231,7 @@ class TestIngestVectorDbAsset:
 
         mock_chromadb_resource.get_collection = mock_get_collection
 
-        context = build_asset_context()
+        context = asset_ctx
 
         result = ingest_vector_db(
             context,
@@ -251,6 +252,7 @@ class TestIngestVectorDbAsset:
         mock_get_device,
         mock_embedding_class,
         mock_chromadb_resource,
+        asset_ctx,
     ):
         """Test ingestion with empty input."""
         mock_get_device.return_value = MagicMock(__str__=lambda self: "cpu")
@@ -262,7 +264,7 @@ class TestIngestVectorDbAsset:
             "metadata": []
         }).lazy()
 
-        context = build_asset_context()
+        context = asset_ctx
 
         result = ingest_vector_db(
             context,
@@ -9,12 +9,11 @@
 
 import pytest
 import polars as pl
-from dagster import build_asset_context
 
 from data_pipeline.defs.assets.merge_wikipedia_articles import merge_wikipedia_articles
 
 
-def test_merge_wikipedia_articles_combines_both():
+def test_merge_wikipedia_articles_combines_both(asset_ctx):
     """Test that merge combines artist and genre articles."""
     # Create mock artist articles
     artists_df = pl.DataFrame([
@@ -50,7 +49,7 @@ def test_merge_wikipedia_articles_combines_both():
         }
     ])
 
-    context = build_asset_context()
+    context = asset_ctx
 
     # Run merge
     result = merge_wikipedia_articles(
@@ -70,7 +69,7 @@ def test_merge_wikipedia_articles_combines_both():
     assert "Q2_chunk_1" in ids
 
 
-def test_merge_wikipedia_articles_empty_artists():
+def test_merge_wikipedia_articles_empty_artists(asset_ctx):
     """Test merge when artist articles are empty."""
     # Empty artists
     artists_df = pl.DataFrame({
@@ -88,7 +87,7 @@ def test_merge_wikipedia_articles_empty_artists():
         }
     ])
 
-    context = build_asset_context()
+    context = asset_ctx
 
     result = merge_wikipedia_articles(
         context,
@@ -101,7 +100,7 @@ def test_merge_wikipedia_articles_empty_artists():
     assert collected["id"][0] == "Q2_chunk_1"
 
 
-def test_merge_wikipedia_articles_empty_genres():
+def test_merge_wikipedia_articles_empty_genres(asset_ctx):
     """Test merge when genre articles are empty."""
     # Artist articles
     artists_df = pl.DataFrame([
@@ -119,7 +118,7 @@ def test_merge_wikipedia_articles_empty_genres():
         "metadata": []
     })
 
-    context = build_asset_context()
+    context = asset_ctx
 
     result = merge_wikipedia_articles(
         context,
@@ -132,7 +131,7 @@ def test_merge_wikipedia_articles_empty_genres():
     assert collected["id"][0] == "Q1_chunk_1"
 
 
-def test_merge_wikipedia_articles_both_empty():
+def test_merge_wikipedia_articles_both_empty(asset_ctx):
     """Test merge when both inputs are empty."""
     artists_df = pl.DataFrame({
         "id": [],
@@ -146,7 +145,7 @@ def test_merge_wikipedia_articles_both_empty():
         "metadata": []
     })
 
-    context = build_asset_context()
+    context = asset_ctx
 
     result = merge_wikipedia_articles(
         context,
@@ -158,7 +157,7 @@ def test_merge_wikipedia_articles_both_empty():
     assert len(collected) == 0
 
 
-def test_merge_wikipedia_articles_multiple_chunks():
+def test_merge_wikipedia_articles_multiple_chunks(asset_ctx):
     """Test merge with multiple chunks from both sources."""
     # Multiple artist chunks
     artists_df = pl.DataFrame([
@@ -173,7 +172,7 @@ def test_merge_wikipedia_articles_multiple_chunks():
         {"id": "Q2_chunk_2", "article": "Genre chunk 2", "metadata": {"entity_type": "genre"}},
     ])
 
-    context = build_asset_context()
+    context = asset_ctx
 
     result = merge_wikipedia_articles(
         context,
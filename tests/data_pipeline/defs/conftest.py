@@ -0,0 +1,22 @@
+# -----------------------------------------------------------
+# Shared Fixtures for Dagster Definition Tests
+# Dagster Data pipeline for Structured and Unstructured Data
+#
+# (C) 2025-2026 Juan-Francisco Reyes, Cottbus, Germany
+# Released under MIT License
+# email pacoreyes@protonmail.com
+# -----------------------------------------------------------
+
+import pytest
+from dagster import build_asset_context
+
+
+@pytest.fixture(scope="module")
+def asset_ctx():
+    """
+    Creates one unpartitioned asset execution context per test module.
+
+    Building a context sets up an ephemeral Dagster instance, so tests that only
+    need logging share this one instead of calling build_asset_context() each time.
+    """
+    return build_asset_context()
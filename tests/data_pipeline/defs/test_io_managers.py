@@ -3,23 +3,27 @@ import polars as pl
 from dagster import build_input_context, build_output_context, AssetKey
 from data_pipeline.defs.io_managers import PolarsParquetIOManager, PolarsJSONLIOManager
 
-def test_parquet_io_manager_path():
-    """Verify path generation for Parquet IO Manager."""
-    manager = PolarsParquetIOManager(base_dir="/tmp/test", extension="parquet")
-    context = build_output_context(asset_key=AssetKey("test_asset"))
-    path = manager._get_path(context)
-    assert str(path) == "/tmp/test/test_asset.parquet"
+def _output_context(partition_key=None):
+    """Builds an output context for 'test_asset', varying only the partition key."""
+    return build_output_context(asset_key=AssetKey("test_asset"), partition_key=partition_key)
 
-def test_jsonl_io_manager_path():
-    """Verify path generation for JSONL IO Manager."""
-    manager = PolarsJSONLIOManager(base_dir="/tmp/test", extension="jsonl")
-    context = build_output_context(asset_key=AssetKey("test_asset"))
-    path = manager._get_path(context)
-    assert str(path) == "/tmp/test/test_asset.jsonl"
+@pytest.mark.parametrize(
+    "manager_cls,extension,partition_key,expected",
+    [
+        (PolarsParquetIOManager, "parquet", None, "/tmp/test/test_asset.parquet"),
+        (PolarsJSONLIOManager, "jsonl", None, "/tmp/test/test_asset.jsonl"),
+        (PolarsParquetIOManager, "parquet", "2020s", "/tmp/test/test_asset/2020s.parquet"),
+    ],
+    ids=["parquet", "jsonl", "parquet_partitioned"],
+)
+def test_io_manager_path(manager_cls, extension, partition_key, expected):
+    """Verify path generation for each IO manager, with and without partitions."""
+    manager = manager_cls(base_dir="/tmp/test", extension=extension)
+    path = manager._get_path(_output_context(partition_key))
+    assert str(path) == expected
 
-def test_io_manager_with_partition():
-    """Verify path generation with partitions."""
+def test_io_manager_path_is_cached():
+    """Verify repeated path lookups for the same asset and partition reuse one Path."""
     manager = PolarsParquetIOManager(base_dir="/tmp/test", extension="parquet")
-    context = build_output_context(asset_key=AssetKey("test_asset"), partition_key="2020s")
-    path = manager._get_path(context)
-    assert str(path) == "/tmp/test/test_asset/2020s.parquet"
+    context = _output_context("2020s")
+    assert manager._get_path(context) is manager._get_path(context)
@@ -1,11 +1,13 @@
 import pytest
 from data_pipeline.defs.partitions import decade_partitions, DECADES_TO_EXTRACT
 
+EXPECTED_KEYS = frozenset(DECADES_TO_EXTRACT.keys())
+
 def test_partitions_defined():
     """Verify that partitions match the expected decades."""
     partition_keys = decade_partitions.get_partition_keys()
-    expected_keys = list(DECADES_TO_EXTRACT.keys())
-    assert sorted(partition_keys) == sorted(expected_keys)
+    assert len(partition_keys) == len(EXPECTED_KEYS)
+    assert frozenset(partition_keys) == EXPECTED_KEYS
 
 def test_decade_ranges():
     """Verify the year ranges for decades."""
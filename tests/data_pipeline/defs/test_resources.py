@@ -22,3 +22,36 @@ def test_resource_defs_contain_expected_keys():
     """Verify that all required resources are in the base resource_defs."""
     expected_keys = {"lastfm", "musicbrainz", "nomic", "chromadb", "neo4j", "wikidata", "wikipedia", "io_manager", "jsonl_io_manager"}
     assert expected_keys.issubset(set(resource_defs.keys()))
+
+def test_neo4j_resource_passes_pool_settings(monkeypatch):
+    """Verify that Neo4jResource builds its shared driver with the configured pool."""
+    mock_get_driver = MagicMock()
+    monkeypatch.setattr("data_pipeline.defs.resources.get_driver", mock_get_driver)
+    resource = Neo4jResource(
+        uri="bolt://localhost:7687",
+        username="neo4j",
+        password="secret",
+        max_connection_pool_size=64,
+        connection_acquisition_timeout=5.0,
+    )
+
+    with resource.get_driver(MagicMock()) as driver:
+        assert driver is mock_get_driver.return_value
+
+    kwargs = mock_get_driver.call_args.kwargs
+    assert kwargs["max_connection_pool_size"] == 64
+    assert kwargs["connection_acquisition_timeout"] == 5.0
+    assert kwargs["max_transaction_retry_time"] == 15.0
+
+def test_neo4j_resource_closes_thread_sessions_on_exit(monkeypatch):
+    """Verify that leaving get_driver closes the sessions cached by the calling thread."""
+    monkeypatch.setattr("data_pipeline.defs.resources.get_driver", MagicMock())
+    mock_close = MagicMock()
+    monkeypatch.setattr("data_pipeline.defs.resources.close_thread_sessions", mock_close)
+    resource = Neo4jResource(uri="bolt://localhost:7687", username="neo4j", password="secret")
+
+    with pytest.raises(RuntimeError), resource.get_driver(MagicMock()):
+        mock_close.assert_not_called()
+        raise RuntimeError("asset failed")
+
+    mock_close.assert_called_once_with()
@@ -0,0 +1,120 @@
+# -----------------------------------------------------------
+# In-memory Neo4j Fakes for Tests
+# Dagster Data pipeline for Structured and Unstructured Data
+#
+# (C) 2025-2026 Juan-Francisco Reyes, Cottbus, Germany
+# Released under MIT License
+# email pacoreyes@protonmail.com
+# -----------------------------------------------------------
+
+"""
+Lightweight stand-ins for the Neo4j driver objects used by neo4j_helpers.
+
+Only the surface the helpers touch is implemented (session, run, execute_write,
+execute_read, single, data, consume, iteration), so tests script responses as plain lists
+and assert on recorded queries instead of MagicMock call chains.
+"""
+
+from types import SimpleNamespace
+from typing import Any
+
+
+class FakeResult:
+    """A canned query result."""
+
+    def __init__(
+        self,
+        single: Any = None,
+        data: list[dict[str, Any]] | None = None,
+        **counters: int,
+    ):
+        self._single = single
+        self._data = data or []
+        self.counters = SimpleNamespace(
+            relationships_deleted=counters.get("relationships_deleted", 0),
+            nodes_deleted=counters.get("nodes_deleted", 0),
+        )
+        self.consumed = False
+
+    def single(self) -> Any:
+        return self._single
+
+    def data(self) -> list[dict[str, Any]]:
+        return list(self._data)
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def consume(self) -> SimpleNamespace:
+        self.consumed = True
+        return SimpleNamespace(counters=self.counters)
+
+
+class FakeSession:
+    """
+    A session that doubles as its own transaction.
+
+    Each `run` pops the next scripted response; an exception instance is raised
+    instead of returned. Once the script is exhausted, empty results are returned.
+    """
+
+    def __init__(self, responses: list[FakeResult | Exception] | None = None):
+        self.responses = list(responses or [])
+        self.queries: list[tuple[str, dict[str, Any]]] = []
+        self.write_calls = 0
+        self.read_calls = 0
+        self._closed = False
+
+    def run(self, query: str, parameters: dict[str, Any] | None = None, **kwargs: Any) -> FakeResult:
+        self.queries.append((query, {**(parameters or {}), **kwargs}))
+        if not self.responses:
+            return FakeResult()
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def execute_write(self, work, *args: Any, **kwargs: Any) -> Any:
+        self.write_calls += 1
+        return work(self, *args, **kwargs)
+
+    def execute_read(self, work, *args: Any, **kwargs: Any) -> Any:
+        self.read_calls += 1
+        return work(self, *args, **kwargs)
+
+    def close(self) -> None:
+        self._closed = True
+
+    def closed(self) -> bool:
+        return self._closed
+
+    def __enter__(self) -> "FakeSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        self.close()
+        return False
+
+
+class FakeDriver:
+    """A driver whose sessions all share one scripted FakeSession."""
+
+    def __init__(
+        self,
+        responses: list[FakeResult | Exception] | None = None,
+        agent: str | None = None,
+    ):
+        self.fake_session = FakeSession(responses)
+        self.agent = agent
+        self.session_calls: list[dict[str, Any]] = []
+
+    def session(self, **kwargs: Any) -> FakeSession:
+        self.session_calls.append(kwargs)
+        self.fake_session._closed = False
+        return self.fake_session
+
+    def get_server_info(self) -> SimpleNamespace:
+        return SimpleNamespace(agent=self.agent)
+
+    def close(self) -> None:
+        pass
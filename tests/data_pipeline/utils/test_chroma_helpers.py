@@ -1,10 +1,25 @@
+import os
+
 import pytest
-import torch
 from unittest.mock import MagicMock, patch
 from data_pipeline.utils.chroma_helpers import get_device, generate_doc_id
 
-def test_get_device():
-    """Verify that get_device returns a torch.device."""
+def test_get_device_cpu(monkeypatch):
+    """Verify that get_device falls back to CPU without probing real accelerators."""
+    torch = pytest.importorskip("torch")
+    monkeypatch.setattr(torch.cuda, "is_available", lambda: False)
+    monkeypatch.setattr(torch.backends.mps, "is_available", lambda: False)
+
+    device = get_device()
+    assert device == torch.device("cpu")
+
+@pytest.mark.gpu
+@pytest.mark.skipif(
+    os.environ.get("RUN_GPU_TESTS") != "1", reason="Set RUN_GPU_TESTS=1 to probe real devices"
+)
+def test_get_device_gpu():
+    """Verify that get_device returns a torch.device when probing real hardware."""
+    torch = pytest.importorskip("torch")
     device = get_device()
     assert isinstance(device, torch.device)
 
@@ -19,3 +34,9 @@ def test_generate_doc_id():
     assert generate_doc_id(text, row_hash) == doc_id
     # Uniqueness
     assert generate_doc_id("different", row_hash) != doc_id
+
+def test_generate_doc_id_bytes():
+    """Verify that bytes input yields the same ID as the equivalent str input."""
+    doc_id = generate_doc_id("Hello World", "row_1")
+
+    assert generate_doc_id(b"Hello World", "row_1") == doc_id
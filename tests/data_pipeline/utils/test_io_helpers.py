@@ -7,30 +7,67 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
+import errno
+import time
+import uuid
+import msgspec
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from data_pipeline.utils.io_helpers import (
+    adopt_flat_cache_file,
+    atomic_publish,
     async_read_json_file,
     async_write_json_file,
     async_read_text_file,
     async_write_text_file,
+    get_sharded_path,
+    migrate_flat_cache_to_shards,
 )
-@pytest.mark.asyncio
-async def test_json_read_write(tmp_path: Path):
-    test_file = tmp_path / "test.json"
+
+
+@pytest.fixture(scope="module")
+def io_tmp(tmp_path_factory) -> Path:
+    """One temporary directory shared by every test in this module."""
+    return tmp_path_factory.mktemp("io_helpers")
+
+
+def _unique(name: str) -> str:
+    """Prefixes a file name with a random token so tests sharing io_tmp never collide."""
+    return f"{uuid.uuid4().hex}_{name}"
+
+
+async def test_json_read_write(fs):
+    test_file = Path("/data/test.json")
     test_data = {"key": "value", "nested": [1, 2, 3]}
     
     # Test write
     await async_write_json_file(test_file, test_data)
     assert test_file.exists()
     
+    # The file holds exactly the compact msgspec encoding
+    assert test_file.read_bytes() == msgspec.json.encode(test_data)
+
     # Test read
     read_data = await async_read_json_file(test_file)
     assert read_data == test_data
 
-@pytest.mark.asyncio
-async def test_text_read_write(tmp_path: Path):
-    test_file = tmp_path / "test.txt"
+@pytest.mark.benchmark
+async def test_json_read_write_large_payload(io_tmp: Path):
+    """Round-trips 10k records well within a generous time budget."""
+    test_file = io_tmp / _unique("large.json")
+    test_data = {f"Q{i}": {"name": f"Artist {i}", "genres": ["QG1", "QG2"]} for i in range(10_000)}
+
+    start = time.perf_counter()
+    await async_write_json_file(test_file, test_data)
+    read_data = await async_read_json_file(test_file)
+    elapsed = time.perf_counter() - start
+
+    assert read_data == test_data
+    assert elapsed < 2.0
+
+async def test_text_read_write(fs):
+    test_file = Path("/data/test.txt")
     test_content = "Hello, World!\nThis is a test."
     
     # Test write
@@ -41,15 +78,80 @@ async def test_text_read_write(tmp_path: Path):
     read_content = await async_read_text_file(test_file)
     assert read_content == test_content
 
-@pytest.mark.asyncio
-async def test_read_non_existent_file(tmp_path: Path):
-    non_existent = tmp_path / "missing.json"
+async def test_read_non_existent_file(fs):
+    non_existent = Path("/data/missing.json")
     assert await async_read_json_file(non_existent) is None
     assert await async_read_text_file(non_existent) is None
 
-@pytest.mark.asyncio
-async def test_auto_mkdir(tmp_path: Path):
-    nested_file = tmp_path / "subdir" / "another" / "test.txt"
+async def test_auto_mkdir(fs):
+    nested_file = Path("/data/subdir/another/test.txt")
     await async_write_text_file(nested_file, "content")
     assert nested_file.exists()
     assert nested_file.parent.exists()
+
+async def test_write_recreates_removed_directory(fs):
+    """A directory removed mid-process is recreated on the next write."""
+    await async_write_text_file(Path("/data/cache/Q12/Q123.txt"), "first")
+    fs.remove_object("/data/cache")
+
+    await async_write_text_file(Path("/data/cache/Q12/Q124.txt"), "second")
+    assert await async_read_text_file(Path("/data/cache/Q12/Q124.txt")) == "second"
+
+@pytest.mark.integration
+async def test_json_read_write_real_fs(io_tmp: Path):
+    """Round-trips JSON through the real filesystem, including parent creation."""
+    test_file = io_tmp / _unique("subdir") / "test.json"
+    test_data = {"key": "value", "nested": [1, 2, 3]}
+
+    await async_write_json_file(test_file, test_data)
+    assert await async_read_json_file(test_file) == test_data
+
+def test_get_sharded_path(io_tmp: Path):
+    assert get_sharded_path(io_tmp, "Q123456", ".txt") == io_tmp / "456" / "Q123456.txt"
+    assert get_sharded_path(io_tmp, "Q5", ".txt") == io_tmp / "Q5" / "Q5.txt"
+    # Sequential QIDs land in different shards
+    shards = {get_sharded_path(io_tmp, f"Q{n}", ".txt").parent for n in range(1000, 2000)}
+    assert len(shards) == 1000
+
+def test_adopt_flat_cache_file(fs):
+    cache_dir = Path("/data/cache")
+    fs.create_file("/data/cache/Q123.txt", contents="flat")
+
+    assert adopt_flat_cache_file(cache_dir, "Q123", ".txt")
+    assert (cache_dir / "123" / "Q123.txt").read_text(encoding="utf-8") == "flat"
+    assert not (cache_dir / "Q123.txt").exists()
+    # Nothing left to move
+    assert not adopt_flat_cache_file(cache_dir, "Q123", ".txt")
+
+def test_migrate_flat_cache_to_shards(io_tmp: Path):
+    # Migration scans a whole directory, so it gets its own
+    cache_dir = io_tmp / _unique("cache")
+    cache_dir.mkdir()
+    (cache_dir / "Q123.txt").write_text("flat", encoding="utf-8")
+    (cache_dir / "Q456.json").write_text("{}", encoding="utf-8")
+
+    assert migrate_flat_cache_to_shards(cache_dir, ".txt") == 1
+    assert (cache_dir / "123" / "Q123.txt").read_text(encoding="utf-8") == "flat"
+    assert not (cache_dir / "Q123.txt").exists()
+    # Files with other suffixes are left alone
+    assert (cache_dir / "Q456.json").exists()
+
+def test_atomic_publish(io_tmp: Path):
+    src = io_tmp / _unique("out.tmp")
+    dst = io_tmp / _unique("out.parquet")
+    src.write_text("data", encoding="utf-8")
+    dst.write_text("old", encoding="utf-8")
+
+    atomic_publish(src, dst)
+    assert dst.read_text(encoding="utf-8") == "data"
+    assert not src.exists()
+
+def test_atomic_publish_cross_device_fallback(io_tmp: Path):
+    src = io_tmp / _unique("out.tmp")
+    dst = io_tmp / _unique("out.parquet")
+    src.write_text("data", encoding="utf-8")
+
+    with patch("data_pipeline.utils.io_helpers.os.replace", side_effect=OSError(errno.EXDEV, "cross-device")), \
+         patch("data_pipeline.utils.io_helpers.shutil.move") as mock_move:
+        atomic_publish(src, dst)
+        mock_move.assert_called_once_with(str(src), str(dst))
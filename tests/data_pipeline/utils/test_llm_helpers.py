@@ -86,13 +86,17 @@ class TestGenerateTextBatch:
     """Tests for generate_text_batch function."""
 
     def test_generate_text_batch_processes_all_prompts(self):
-        """Test that generate_text_batch processes all prompts sequentially."""
+        """Test that generate_text_batch returns one response per prompt, in order."""
         mock_model = MagicMock()
         mock_tokenizer = MagicMock()
         mock_tokenizer.apply_chat_template.return_value = "formatted"
+        responses = ["Response 1", "Response 2", "Response 3"]
 
-        with patch("mlx_lm.generate") as mock_generate:
-            mock_generate.side_effect = ["Response 1", "Response 2", "Response 3"]
+        # Either a single batched call or one call per prompt is acceptable
+        with patch("mlx_lm.generate") as mock_generate, \
+             patch("mlx_lm.batch_generate", create=True) as mock_batch_generate:
+            mock_generate.side_effect = responses
+            mock_batch_generate.return_value = MagicMock(texts=responses)
 
             from data_pipeline.utils.llm_helpers import generate_text_batch
             results = generate_text_batch(
@@ -100,11 +104,45 @@ class TestGenerateTextBatch:
                 ["Prompt 1", "Prompt 2", "Prompt 3"]
             )
 
-            assert len(results) == 3
-            assert results[0] == "Response 1"
-            assert results[1] == "Response 2"
-            assert results[2] == "Response 3"
-            assert mock_generate.call_count == 3
+            assert results == responses
+            assert mock_generate.call_count + mock_batch_generate.call_count in (1, 3)
+
+    @pytest.mark.parametrize("batched", [True, False], ids=["batched", "sequential"])
+    def test_generate_text_batch_preserves_prompt_order(self, batched, monkeypatch):
+        """Test that responses line up with their prompts on both generation paths."""
+        mock_model = MagicMock()
+        mock_tokenizer = MagicMock()
+
+        def fake_chat_template(messages, **kwargs):
+            # Batched calls pass one conversation per prompt and need plain token ids
+            if isinstance(messages[0], list):
+                assert kwargs["return_dict"] is False
+                return [conversation[0]["content"] for conversation in messages]
+            return messages[0]["content"]
+
+        mock_tokenizer.apply_chat_template.side_effect = fake_chat_template
+        prompts = [f"Prompt {i}" for i in range(5)]
+
+        monkeypatch.setattr(
+            "mlx_lm.generate",
+            lambda model, tokenizer, prompt, **kwargs: f"{prompt}_done",
+        )
+        if batched:
+            monkeypatch.setattr(
+                "mlx_lm.batch_generate",
+                lambda model, tokenizer, prompts, **kwargs: MagicMock(
+                    texts=[f"{p}_done" for p in prompts]
+                ),
+                raising=False,
+            )
+        else:
+            # Simulate an mlx-lm release without batched generation
+            monkeypatch.delattr("mlx_lm.batch_generate", raising=False)
+
+        from data_pipeline.utils.llm_helpers import generate_text_batch
+        results = generate_text_batch(mock_model, mock_tokenizer, prompts)
+
+        assert results == [f"{p}_done" for p in prompts]
 
     def test_generate_text_batch_empty_list(self):
         """Test generate_text_batch with empty prompt list."""
@@ -21,7 +21,6 @@ def mock_make_request(mocker):
 def mock_cache_path(tmp_path):
     return tmp_path
 
-@pytest.mark.asyncio
 async def test_fetch_artist_release_groups_async_uncached_success(mock_make_request, mock_cache_path):
     """
     Test fetching from API when not cached.
@@ -72,7 +71,6 @@ async def test_fetch_artist_release_groups_async_uncached_success(mock_make_requ
     cache_file = mock_cache_path / "mbid-test_release.json"
     assert cache_file.exists()
 
-@pytest.mark.asyncio
 async def test_fetch_artist_release_groups_async_cached(mock_make_request, mock_cache_path):
     """
     Test loading from cache.
@@ -105,7 +103,6 @@ async def test_fetch_artist_release_groups_async_cached(mock_make_request, mock_
     mock_make_request.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_fetch_releases_for_group_async(mock_make_request, mock_cache_path):
     """Test fetching releases for a release group."""
     rg_data = {
@@ -150,7 +147,6 @@ async def test_fetch_releases_for_group_async(mock_make_request, mock_cache_path
     mock_make_request.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_fetch_tracks_for_release_async(mock_make_request, mock_cache_path):
     """Test fetching tracks for a specific release."""
     rel_data = {
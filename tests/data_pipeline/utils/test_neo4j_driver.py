@@ -0,0 +1,63 @@
+# -----------------------------------------------------------
+# Tests for Neo4j Driver and Session Cache
+# Dagster Data pipeline for Structured and Unstructured Data
+#
+# (C) 2025-2026 Juan-Francisco Reyes, Cottbus, Germany
+# Released under MIT License
+# email pacoreyes@protonmail.com
+# -----------------------------------------------------------
+
+from unittest.mock import MagicMock, patch
+
+from data_pipeline.settings import settings
+from data_pipeline.utils.neo4j_driver import close_drivers, get_driver
+
+
+class TestGetDriver:
+    """Tests for the get_driver singleton cache."""
+
+    def test_get_driver_reuses_driver(self, monkeypatch):
+        """Test that repeated calls with the same credentials share one driver."""
+        monkeypatch.setattr("data_pipeline.utils.neo4j_driver._driver_cache", {})
+
+        with patch("data_pipeline.utils.neo4j_driver.GraphDatabase") as mock_graph_db:
+            first = get_driver("bolt://localhost:7687", ("neo4j", "secret"))
+            second = get_driver("bolt://localhost:7687", ("neo4j", "secret"))
+            other = get_driver("bolt://localhost:7687", ("neo4j", "other"))
+
+        assert first is second
+        assert mock_graph_db.driver.call_count == 2
+        assert other is mock_graph_db.driver.return_value
+        assert mock_graph_db.driver.call_args_list[0].kwargs["max_connection_pool_size"] == (
+            settings.NEO4J_MAX_CONNECTION_POOL_SIZE
+        )
+
+    def test_get_driver_keys_on_pool_options(self, monkeypatch):
+        """Test that differing pool options get their own driver instead of the cached one."""
+        monkeypatch.setattr("data_pipeline.utils.neo4j_driver._driver_cache", {})
+
+        with patch("data_pipeline.utils.neo4j_driver.GraphDatabase") as mock_graph_db:
+            mock_graph_db.driver.side_effect = lambda *args, **kwargs: MagicMock()
+            default = get_driver("bolt://localhost:7687", ("neo4j", "secret"))
+            explicit_default = get_driver(
+                "bolt://localhost:7687",
+                ("neo4j", "secret"),
+                max_connection_pool_size=settings.NEO4J_MAX_CONNECTION_POOL_SIZE,
+            )
+            small_pool = get_driver("bolt://localhost:7687", ("neo4j", "secret"), max_connection_pool_size=5)
+
+        assert default is explicit_default
+        assert small_pool is not default
+        assert mock_graph_db.driver.call_count == 2
+        assert mock_graph_db.driver.call_args_list[1].kwargs["max_connection_pool_size"] == 5
+
+    def test_close_drivers_closes_and_clears_cache(self, monkeypatch):
+        """Test that close_drivers closes every cached driver."""
+        cached = MagicMock()
+        cache = {("bolt://localhost:7687", "neo4j", "hash"): cached}
+        monkeypatch.setattr("data_pipeline.utils.neo4j_driver._driver_cache", cache)
+
+        close_drivers()
+
+        cached.close.assert_called_once()
+        assert cache == {}
@@ -7,25 +7,44 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-from unittest.mock import MagicMock
+import threading
+from unittest.mock import MagicMock, patch
 
+import leidenalg
 import pytest
-from neo4j.exceptions import ServiceUnavailable, SessionExpired
+from neo4j.exceptions import (
+    ClientError,
+    ServiceUnavailable,
+    SessionExpired,
+    TransientError,
+)
 
+from data_pipeline.utils.neo4j_driver import close_thread_sessions
 from data_pipeline.utils.neo4j_helpers import (
     _execute_with_retry,
     build_igraph,
     clear_database,
     execute_cypher,
+    execute_cypher_batch,
     get_community_stats,
     run_leiden_multilevel,
 )
+from tests.data_pipeline.utils._fakes import FakeDriver, FakeResult, FakeSession
 
 
 @pytest.fixture
 def mock_driver():
-    """Creates a mock Neo4j driver."""
-    return MagicMock()
+    """Creates an in-memory Neo4j driver with an empty response script."""
+    yield FakeDriver()
+    close_thread_sessions()
+
+
+def make_row(deleted: int | None = None, data_rows: list[dict] | None = None) -> FakeResult:
+    """Builds a scripted result: a batch-delete count for single(), or rows for data()."""
+    return FakeResult(
+        single=None if deleted is None else {"deleted": deleted},
+        data=data_rows,
+    )
 
 
 @pytest.fixture
@@ -41,22 +60,16 @@ class TestExecuteCypher:
 
     def test_execute_cypher_transactional_success(self, mock_driver):
         """Test execute_cypher with transactional=True uses execute_write."""
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
-
         execute_cypher(mock_driver, "CREATE (n:Test)", {"name": "test"})
 
-        mock_driver.session.assert_called_once_with(database="neo4j")
-        mock_session.execute_write.assert_called_once()
+        assert mock_driver.session_calls == [{"database": "neo4j"}]
+        assert mock_driver.fake_session.write_calls == 1
+        assert mock_driver.fake_session.queries == [("CREATE (n:Test)", {"name": "test"})]
 
     def test_execute_cypher_non_transactional_success(self, mock_driver):
         """Test execute_cypher with transactional=False uses session.run."""
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_session.run.return_value = mock_result
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        result = FakeResult()
+        mock_driver.fake_session.responses.append(result)
 
         execute_cypher(
             mock_driver,
@@ -64,55 +77,173 @@ class TestExecuteCypher:
             transactional=False
         )
 
-        mock_driver.session.assert_called_once_with(database="neo4j")
-        mock_session.run.assert_called_once()
-        mock_result.consume.assert_called_once()
+        assert mock_driver.session_calls == [{"database": "neo4j"}]
+        assert mock_driver.fake_session.write_calls == 0
+        assert len(mock_driver.fake_session.queries) == 1
+        assert result.consumed
 
     def test_execute_cypher_raises_on_error(self, mock_driver):
         """Test that exceptions are propagated correctly."""
-        mock_session = MagicMock()
-        mock_session.execute_write.side_effect = Exception("Connection failed")
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_driver.fake_session.responses.append(Exception("Connection failed"))
 
         with pytest.raises(Exception, match="Connection failed"):
             execute_cypher(mock_driver, "CREATE (n:Test)")
 
+    def test_execute_cypher_reuses_provided_session(self, mock_driver):
+        """Test execute_cypher runs on the given session without opening a new one."""
+        session = FakeSession()
+
+        execute_cypher(mock_driver, "CREATE (n:Test)", session=session)
+        execute_cypher(mock_driver, "CREATE INDEX i FOR (n:Test) ON (n.id)", transactional=False, session=session)
+
+        assert mock_driver.session_calls == []
+        assert session.write_calls == 1
+        assert len(session.queries) == 2
+
+    def test_execute_cypher_rejects_database_with_session(self, mock_driver):
+        """Test that a database cannot be chosen for an already-open session."""
+        session = FakeSession()
+
+        with pytest.raises(ValueError, match="database='system'"):
+            execute_cypher(mock_driver, "CREATE (n:Test)", database="system", session=session)
+
+        assert session.queries == []
+
+    def test_execute_cypher_reuses_thread_session(self, mock_driver):
+        """Test that session-less calls on one thread share a cached session until closed."""
+        execute_cypher(mock_driver, "CREATE (n:Test)")
+        execute_cypher(mock_driver, "CREATE (n:Test)")
+        assert mock_driver.session_calls == [{"database": "neo4j"}]
+
+        close_thread_sessions()
+        assert mock_driver.fake_session.closed()
+
+        execute_cypher(mock_driver, "CREATE (n:Test)")
+        assert len(mock_driver.session_calls) == 2
+
+    def test_close_thread_sessions_leaves_other_threads_open(self):
+        """Test that each thread gets its own session and only closes its own."""
+        main_driver, worker_driver = FakeDriver(), FakeDriver()
+        opened = threading.Event()
+        release = threading.Event()
+
+        def worker():
+            execute_cypher(worker_driver, "CREATE (n:Test)")
+            opened.set()
+            release.wait(timeout=5)
+            close_thread_sessions()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        opened.wait(timeout=5)
+
+        execute_cypher(main_driver, "CREATE (n:Test)")
+        close_thread_sessions()
+
+        assert main_driver.fake_session.closed()
+        assert not worker_driver.fake_session.closed()
+
+        release.set()
+        thread.join(timeout=5)
+        assert worker_driver.fake_session.closed()
+
+class TestExecuteCypherBatch:
+    """Tests for execute_cypher_batch function."""
+
+    @pytest.mark.parametrize("num_rows,chunk_size,expected_calls", [
+        (2500, 1000, 3),
+        (1000, 1000, 1),
+        (1, 1000, 1),
+    ])
+    def test_execute_cypher_batch_chunks_rows(self, mock_driver, num_rows, chunk_size, expected_calls):
+        """Test that rows are sent in ceil(len / chunk_size) transactions on one session."""
+        rows = [{"id": i} for i in range(num_rows)]
+
+        sent = execute_cypher_batch(
+            mock_driver, "UNWIND $rows AS row MERGE (n:Test {id: row.id})", rows, chunk_size=chunk_size
+        )
+
+        assert sent == num_rows
+        assert mock_driver.fake_session.write_calls == expected_calls
+        assert len(mock_driver.session_calls) == 1
+        # Every row is sent exactly once, in order
+        sent_rows = [r for _, params in mock_driver.fake_session.queries for r in params["rows"]]
+        assert sent_rows == rows
+
+    def test_execute_cypher_batch_empty_rows(self, mock_driver):
+        """Test that an empty payload opens no session."""
+        assert execute_cypher_batch(mock_driver, "UNWIND $rows AS row RETURN row", []) == 0
+        assert mock_driver.session_calls == []
+
+    def test_execute_cypher_batch_accepts_iterator(self, mock_driver):
+        """Test that rows may be a lazy iterator, as yielded by DataFrame.iter_rows."""
+        rows = ({"id": i} for i in range(5))
+
+        sent = execute_cypher_batch(mock_driver, "UNWIND $rows AS row RETURN row", rows, chunk_size=2)
+
+        assert sent == 5
+        assert [len(params["rows"]) for _, params in mock_driver.fake_session.queries] == [2, 2, 1]
+
 
 class TestExecuteWithRetry:
     """Tests for _execute_with_retry function."""
 
-    def test_execute_with_retry_success_first_attempt(self, mock_driver):
-        """Test successful execution on first attempt."""
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.single.return_value = {"count": 10}
-        mock_session.run.return_value = mock_result
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+    @pytest.mark.parametrize("fetch,expected", [
+        ("single", {"count": 10}),
+        ("all", [{"count": 10}, {"count": 20}]),
+        ("none", None),
+    ])
+    def test_execute_with_retry_success_first_attempt(self, mock_driver, fetch, expected):
+        """Test successful execution on first attempt for each fetch mode."""
+        result = FakeResult(single={"count": 10}, data=[{"count": 10}, {"count": 20}])
+        mock_driver.fake_session.responses.append(result)
+
+        returned = _execute_with_retry(
+            mock_driver, "MATCH (n) RETURN count(n) AS count", params={"limit": 5}, fetch=fetch
+        )
+
+        assert returned == expected
+        assert result.consumed == (fetch == "none")
+        assert len(mock_driver.session_calls) == 1
+        assert mock_driver.fake_session.queries == [("MATCH (n) RETURN count(n) AS count", {"limit": 5})]
+
+    def test_execute_with_retry_rejects_unknown_fetch(self, mock_driver):
+        """Test that an unknown fetch mode fails before any session is opened."""
+        with pytest.raises(ValueError, match="Unknown fetch mode"):
+            _execute_with_retry(mock_driver, "MATCH (n) RETURN n", fetch="many")
+
+        assert mock_driver.session_calls == []
 
-        result = _execute_with_retry(mock_driver, "MATCH (n) RETURN count(n) AS count")
+    def test_execute_with_retry_relies_on_driver_transaction_retry(self, mock_driver):
+        """Test that a transient failure is retried by execute_write within one session."""
 
-        assert result == {"count": 10}
-        assert mock_driver.session.call_count == 1
+        class RetryingSession(FakeSession):
+            def execute_write(self, work, *args, **kwargs):
+                # Mimic the driver re-running the transaction function after a transient error
+                try:
+                    return super().execute_write(work, *args, **kwargs)
+                except SessionExpired:
+                    return super().execute_write(work, *args, **kwargs)
+
+        mock_driver.fake_session = RetryingSession(
+            [SessionExpired("Connection lost"), FakeResult(single={"deleted": 5})]
+        )
+
+        with patch("data_pipeline.utils.neo4j_helpers.time.sleep") as mock_sleep:
+            result = _execute_with_retry(mock_driver, "MATCH (n) DELETE n RETURN count(*) AS deleted")
+
+        assert result == {"deleted": 5}
+        assert len(mock_driver.session_calls) == 1
+        assert len(mock_driver.fake_session.queries) == 2
+        mock_sleep.assert_not_called()
 
     def test_execute_with_retry_recovers_from_transient_failure(self, mock_driver):
         """Test retry logic recovers from SessionExpired."""
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.single.return_value = {"deleted": 100}
-
         # First call fails, second succeeds
-        call_count = [0]
-        def side_effect(*args, **kwargs):
-            call_count[0] += 1
-            if call_count[0] == 1:
-                raise SessionExpired("Connection lost")
-            return mock_result
-
-        mock_session.run.side_effect = side_effect
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_driver.fake_session.responses.extend([
+            SessionExpired("Connection lost"),
+            FakeResult(single={"deleted": 100}),
+        ])
 
         result = _execute_with_retry(
             mock_driver,
@@ -122,14 +253,13 @@ class TestExecuteWithRetry:
         )
 
         assert result == {"deleted": 100}
-        assert call_count[0] == 2
+        assert len(mock_driver.fake_session.queries) == 2
 
     def test_execute_with_retry_exhausts_retries(self, mock_driver):
         """Test that exception is raised after max retries."""
-        mock_session = MagicMock()
-        mock_session.run.side_effect = ServiceUnavailable("Service unavailable")
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_driver.fake_session.responses.extend(
+            [ServiceUnavailable("Service unavailable") for _ in range(3)]
+        )
 
         with pytest.raises(ServiceUnavailable, match="Service unavailable"):
             _execute_with_retry(
@@ -140,28 +270,86 @@ class TestExecuteWithRetry:
             )
 
         # Should have tried 3 times (initial + 2 retries)
-        assert mock_session.run.call_count == 3
+        assert len(mock_driver.fake_session.queries) == 3
+
+
+    def test_execute_with_retry_retries_transient_error(self, mock_driver):
+        """Test that a server-side TransientError (e.g. deadlock) is retried."""
+        mock_driver.fake_session.responses.extend([
+            TransientError("Deadlock detected"),
+            FakeResult(single={"deleted": 1}),
+        ])
+
+        with patch("data_pipeline.utils.neo4j_helpers.time.sleep") as mock_sleep:
+            result = _execute_with_retry(mock_driver, "MATCH (n) DELETE n RETURN count(*) AS deleted", max_retries=1)
+
+        assert result == {"deleted": 1}
+        mock_sleep.assert_called_once()
+
+    def test_execute_with_retry_fails_fast_on_client_error(self, mock_driver):
+        """Test that a ClientError (e.g. a syntax error) raises after one attempt without sleeping."""
+        mock_driver.fake_session.responses.append(ClientError("Invalid input"))
+
+        with (
+            patch("data_pipeline.utils.neo4j_helpers.time.sleep") as mock_sleep,
+            pytest.raises(ClientError),
+        ):
+            _execute_with_retry(mock_driver, "MATCH (n RETURN n", max_retries=3)
+
+        assert len(mock_driver.fake_session.queries) == 1
+        mock_sleep.assert_not_called()
+
+    def test_execute_with_retry_fails_fast_on_non_retryable_transient_error(self, mock_driver):
+        """Test that a TransientError whose is_retryable() is False is not retried."""
+        error = TransientError("Transaction terminated")
+        error._retryable = False
+        mock_driver.fake_session.responses.append(error)
+
+        with (
+            patch("data_pipeline.utils.neo4j_helpers.time.sleep") as mock_sleep,
+            pytest.raises(TransientError),
+        ):
+            _execute_with_retry(mock_driver, "MATCH (n) RETURN n", max_retries=3)
+
+        assert len(mock_driver.fake_session.queries) == 1
+        mock_sleep.assert_not_called()
+
+    def test_execute_with_retry_backoff_has_capped_jitter(self, mock_driver):
+        """Test that backoff delays are jittered and never exceed max_delay."""
+        mock_driver.fake_session.responses.extend(
+            [ServiceUnavailable("Service unavailable") for _ in range(4)]
+        )
+
+        with (
+            patch("data_pipeline.utils.neo4j_helpers.time.sleep") as mock_sleep,
+            patch("data_pipeline.utils.neo4j_helpers._retry_rng.random", return_value=1.0),
+            pytest.raises(ServiceUnavailable),
+        ):
+            _execute_with_retry(
+                mock_driver,
+                "MATCH (n) RETURN n",
+                max_retries=3,
+                base_delay=2.0,
+                jitter=0.5,
+                max_delay=5.0,
+            )
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        # 2.0 * 1.5 = 3.0, then 6.0 and 12.0 are capped at 5.0
+        assert delays == [3.0, 5.0, 5.0]
 
 
 class TestClearDatabase:
     """Tests for clear_database function."""
 
     def test_clear_database_deletes_relationships_then_nodes(self, mock_driver, mock_context):
-        """Test that clear_database deletes relationships first, then nodes."""
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
-
-        # Simulate: relationships deleted, then nodes deleted
-        mock_results = [
-            MagicMock(single=MagicMock(return_value={"deleted": 50})),   # rels batch 1
-            MagicMock(single=MagicMock(return_value={"deleted": 0})),    # rels done
-            MagicMock(single=MagicMock(return_value={"deleted": 100})),  # nodes batch 1
-            MagicMock(single=MagicMock(return_value={"deleted": 0})),    # nodes done
-            MagicMock(data=MagicMock(return_value=[])),  # SHOW INDEXES
-            MagicMock(data=MagicMock(return_value=[])),  # SHOW CONSTRAINTS
-        ]
-        mock_session.run.side_effect = mock_results
+        """Test that clear_database deletes relationships first, then nodes, server-side."""
+        mock_driver.agent = "Neo4j/5.26.0"
+        # One statement per phase, batched by the server; SHOW INDEXES/CONSTRAINTS come back empty
+        mock_driver.fake_session.responses.extend([
+            FakeResult(relationships_deleted=50),  # CALL { DELETE r } IN TRANSACTIONS
+            FakeResult(nodes_deleted=100),  # CALL { DETACH DELETE n } IN TRANSACTIONS
+        ])
 
         clear_database(mock_driver, mock_context, batch_size=100)
 
@@ -169,50 +357,61 @@ class TestClearDatabase:
         mock_context.log.info.assert_any_call("Starting database cleanup...")
         mock_context.log.info.assert_any_call("Deleted 50 relationships.")
         mock_context.log.info.assert_any_call("Deleted 100 nodes.")
+        # Relationships go first, and each phase is batched in a single statement
+        queries = [q for q, _ in mock_driver.fake_session.queries]
+        assert "DELETE r" in queries[0] and "IN TRANSACTIONS OF 100 ROWS" in queries[0]
+        assert "DETACH DELETE n" in queries[1] and "IN TRANSACTIONS OF 100 ROWS" in queries[1]
+        # A single session is shared by all cleanup statements
+        assert len(mock_driver.session_calls) == 1
+
+    def test_clear_database_batches_client_side_on_old_server(self, mock_driver, mock_context):
+        """Test that servers older than 4.4 use the iterative batch loop."""
+        mock_driver.agent = "Neo4j/4.3.0"
+        # Simulate: relationships deleted, then nodes deleted
+        mock_driver.fake_session.responses.extend([
+            make_row(deleted=50),   # rels batch 1
+            make_row(deleted=0),    # rels done
+            make_row(deleted=100),  # nodes batch 1
+            make_row(deleted=0),    # nodes done
+        ])
+
+        clear_database(mock_driver, mock_context, batch_size=100)
+
+        mock_context.log.info.assert_any_call("Deleted 50 relationships.")
+        mock_context.log.info.assert_any_call("Deleted 100 nodes.")
+        assert len(mock_driver.session_calls) == 1
+
+    def test_clear_database_falls_back_when_server_batching_fails(self, mock_driver, mock_context):
+        """Test that a transient failure in the server-side delete falls back to the loop."""
+        mock_driver.agent = "Neo4j/5.26.0"
+        mock_driver.fake_session.responses.extend([
+            SessionExpired("Connection lost"),  # CALL ... IN TRANSACTIONS
+            make_row(deleted=0),  # No rels left
+            make_row(deleted=0),  # No nodes left
+        ])
+
+        clear_database(mock_driver, mock_context)
+
+        mock_context.log.warning.assert_called_once()
+        mock_context.log.info.assert_any_call("Deleted 0 nodes.")
 
     def test_clear_database_handles_empty_database(self, mock_driver, mock_context):
         """Test clear_database handles an already empty database."""
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
-
-        # Database is already empty
-        mock_results = [
-            MagicMock(single=MagicMock(return_value={"deleted": 0})),  # No rels
-            MagicMock(single=MagicMock(return_value={"deleted": 0})),  # No nodes
-            MagicMock(data=MagicMock(return_value=[])),  # SHOW INDEXES
-            MagicMock(data=MagicMock(return_value=[])),  # SHOW CONSTRAINTS
-        ]
-        mock_session.run.side_effect = mock_results
-
+        # Database is already empty: every scripted result is empty
         clear_database(mock_driver, mock_context)
 
         mock_context.log.info.assert_any_call("Deleted 0 nodes.")
 
     def test_clear_database_drops_indexes(self, mock_driver, mock_context):
         """Test that clear_database drops existing indexes."""
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
-
-        mock_indexes_result = MagicMock()
-        mock_indexes_result.data.return_value = [
-            {"name": "artist_idx", "type": "RANGE"},
-            {"name": "genre_idx", "type": "BTREE"},
-        ]
-
-        mock_constraints_result = MagicMock()
-        mock_constraints_result.data.return_value = []
-
-        mock_results = [
-            MagicMock(single=MagicMock(return_value={"deleted": 0})),  # No rels
-            MagicMock(single=MagicMock(return_value={"deleted": 0})),  # No nodes
-            mock_indexes_result,  # SHOW INDEXES
-            MagicMock(),  # DROP INDEX artist_idx
-            MagicMock(),  # DROP INDEX genre_idx
-            mock_constraints_result,  # SHOW CONSTRAINTS
-        ]
-        mock_session.run.side_effect = mock_results
+        mock_driver.fake_session.responses.extend([
+            make_row(deleted=0),  # No rels
+            make_row(deleted=0),  # No nodes
+            make_row(data_rows=[
+                {"name": "artist_idx", "type": "RANGE"},
+                {"name": "genre_idx", "type": "BTREE"},
+            ]),  # SHOW INDEXES
+        ])
 
         clear_database(mock_driver, mock_context)
 
@@ -222,38 +421,40 @@ class TestClearDatabase:
 
     def test_clear_database_drops_constraints(self, mock_driver, mock_context):
         """Test that clear_database drops existing constraints."""
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_driver.fake_session.responses.extend([
+            make_row(deleted=0),  # No rels
+            make_row(deleted=0),  # No nodes
+            make_row(),  # SHOW INDEXES
+            make_row(data_rows=[{"name": "artist_unique"}]),  # SHOW CONSTRAINTS
+        ])
 
-        mock_indexes_result = MagicMock()
-        mock_indexes_result.data.return_value = []
+        clear_database(mock_driver, mock_context)
 
-        mock_constraints_result = MagicMock()
-        mock_constraints_result.data.return_value = [
-            {"name": "artist_unique"},
-        ]
+        mock_context.log.info.assert_any_call("Dropped constraint: artist_unique")
 
-        mock_results = [
-            MagicMock(single=MagicMock(return_value={"deleted": 0})),  # No rels
-            MagicMock(single=MagicMock(return_value={"deleted": 0})),  # No nodes
-            mock_indexes_result,  # SHOW INDEXES
-            mock_constraints_result,  # SHOW CONSTRAINTS
-            MagicMock(),  # DROP CONSTRAINT
-        ]
-        mock_session.run.side_effect = mock_results
+    def test_clear_database_drops_constraints_before_quoted_indexes(self, mock_driver, mock_context):
+        """Test that schema drops run constraints first, with quoted names and IF EXISTS."""
+        mock_driver.fake_session.responses.extend([
+            make_row(deleted=0),  # No rels
+            make_row(deleted=0),  # No nodes
+            make_row(data_rows=[
+                {"name": "artist id", "type": "RANGE"},
+                {"name": "lookup_idx", "type": "LOOKUP"},  # System index, kept
+            ]),  # SHOW INDEXES
+            make_row(data_rows=[{"name": "odd`name"}]),  # SHOW CONSTRAINTS
+        ])
 
         clear_database(mock_driver, mock_context)
 
-        mock_context.log.info.assert_any_call("Dropped constraint: artist_unique")
+        drops = [q for q, _ in mock_driver.fake_session.queries if q.startswith("DROP")]
+        assert drops == [
+            "DROP CONSTRAINT `odd``name` IF EXISTS",
+            "DROP INDEX `artist id` IF EXISTS",
+        ]
 
     def test_clear_database_raises_on_persistent_error(self, mock_driver, mock_context):
         """Test that errors are raised after retries are exhausted."""
-        mock_session = MagicMock()
-        mock_driver.session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_driver.session.return_value.__exit__ = MagicMock(return_value=False)
-
-        mock_session.run.side_effect = ServiceUnavailable("Persistent failure")
+        mock_driver.fake_session.responses.append(ServiceUnavailable("Persistent failure"))
 
         with pytest.raises(ServiceUnavailable, match="Persistent failure"):
             clear_database(mock_driver, mock_context)
@@ -376,6 +577,77 @@ class TestRunLeidenMultilevel:
 
         assert memberships1 == memberships2
 
+    def test_run_leiden_independent_levels_run_in_worker_processes(self):
+        """Test that independent levels run in pool workers and match the serial result."""
+        nodes = [{"id": str(i)} for i in range(20)]
+        edges = (
+            [(str(i), str(j)) for i in range(10) for j in range(i + 1, 10)]
+            + [(str(i), str(j)) for i in range(10, 20) for j in range(i + 1, 20)]
+            + [("5", "15")]
+        )
+        graph, _ = build_igraph(nodes, edges)
+        resolutions = [0.1, 2.0, 0.5]
+
+        serial = run_leiden_multilevel(graph, resolutions, max_workers=1)
+
+        # A spy in this process only sees calls made here, not in the workers
+        with patch(
+            "data_pipeline.utils.neo4j_helpers.leidenalg.find_partition",
+            wraps=leidenalg.find_partition,
+        ) as spy:
+            parallel = run_leiden_multilevel(graph, resolutions, max_workers=2)
+
+        assert spy.call_count == 0
+        assert parallel == serial
+
+    def test_run_leiden_contracted_levels_nest(self):
+        """Test that contracted coarse levels are unions of the finer communities."""
+        nodes = [{"id": str(i)} for i in range(20)]
+        edges = (
+            [(str(i), str(j)) for i in range(10) for j in range(i + 1, 10)]
+            + [(str(i), str(j)) for i in range(10, 20) for j in range(i + 1, 20)]
+            + [("5", "15")]
+        )
+        graph, _ = build_igraph(nodes, edges)
+
+        fine, coarse = run_leiden_multilevel(graph, [2.0, 0.1], warm_start=True, contract=True)
+
+        assert len(coarse) == 20
+        assert len(set(coarse)) <= len(set(fine))
+        # Every fine community maps to exactly one coarse community
+        assert all(len({coarse[v] for v in range(20) if fine[v] == c}) == 1 for c in set(fine))
+        assert run_leiden_multilevel(graph, [2.0, 0.1], warm_start=True, contract=True) == [fine, coarse]
+
+    def test_run_leiden_warm_start_chains_levels_in_caller_order(self):
+        """Test that each coarser level starts from the finer level's membership."""
+        graph = MagicMock()
+        calls = []
+
+        def fake_find_partition(g, partition_type, initial_membership=None, resolution_parameter=None, seed=None):
+            calls.append((resolution_parameter, initial_membership))
+            return MagicMock(membership=[resolution_parameter])
+
+        with patch("data_pipeline.utils.neo4j_helpers.leidenalg.find_partition", side_effect=fake_find_partition):
+            memberships = run_leiden_multilevel(graph, [0.5, 2.0, 0.1], warm_start=True)
+
+        assert calls == [(2.0, None), (0.5, [2.0]), (0.1, [0.5])]
+        assert memberships == [[0.5], [2.0], [0.1]]
+
+
+    def test_run_leiden_defaults_to_independent_levels(self):
+        """Test that levels are not warm-started unless requested."""
+        graph = MagicMock()
+        calls = []
+
+        def fake_find_partition(g, partition_type, initial_membership=None, resolution_parameter=None, seed=None):
+            calls.append((resolution_parameter, initial_membership))
+            return MagicMock(membership=[resolution_parameter])
+
+        with patch("data_pipeline.utils.neo4j_helpers.leidenalg.find_partition", side_effect=fake_find_partition):
+            memberships = run_leiden_multilevel(graph, [0.5, 2.0], max_workers=1)
+
+        assert calls == [(0.5, None), (2.0, None)]
+        assert memberships == [[0.5], [2.0]]
 
 class TestGetCommunityStats:
     """Tests for get_community_stats function."""
@@ -403,6 +675,16 @@ class TestGetCommunityStats:
         assert stats["smallest"] == 5
         assert stats["mean_size"] == 5.0
 
+    def test_get_community_stats_sparse_ids(self):
+        """Test that gaps in community IDs are not counted as communities."""
+        membership = [5, 5, 2]
+
+        stats = get_community_stats(membership)
+
+        assert stats["num_communities"] == 2
+        assert stats["sizes"] == [2, 1]
+        assert isinstance(stats["largest"], int)
+
     def test_get_community_stats_empty(self):
         """Test stats with empty membership."""
         stats = get_community_stats([])
@@ -2,9 +2,8 @@ import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
 from dagster import build_asset_context
-from data_pipeline.utils.network_helpers import run_tasks_concurrently
+from data_pipeline.utils.network_helpers import run_tasks_concurrently, yield_batches_concurrently, yield_batches_in_order
 
-@pytest.mark.asyncio
 async def test_run_tasks_concurrently():
     """Verify that run_tasks_concurrently processes items and returns results."""
     items = [1, 2, 3]
@@ -15,8 +14,84 @@ async def test_run_tasks_concurrently():
     results = await run_tasks_concurrently(items, processor, concurrency_limit=2)
     assert results == [2, 4, 6]
 
-@pytest.mark.asyncio
 async def test_run_tasks_concurrently_empty():
     """Verify handling of empty item list."""
     results = await run_tasks_concurrently([], AsyncMock(), concurrency_limit=2)
     assert results == []
+
+async def test_run_tasks_concurrently_bounds_in_flight_work():
+    """Verify that at most concurrency_limit items are processed at once, in input order."""
+    in_flight = 0
+    peak = 0
+
+    async def processor(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (item % 3))
+        in_flight -= 1
+        return item
+
+    results = await run_tasks_concurrently(list(range(50)), processor, concurrency_limit=4)
+    assert results == list(range(50))
+    assert peak == 4
+
+async def test_run_tasks_concurrently_propagates_errors():
+    """Verify that a failing item raises instead of leaving a hole in the results."""
+    async def processor(item):
+        if item == 2:
+            raise ValueError("boom")
+        return item
+
+    with pytest.raises(ValueError, match="boom"):
+        await run_tasks_concurrently([1, 2, 3], processor, concurrency_limit=2)
+
+async def test_run_tasks_concurrently_rejects_non_positive_limit():
+    """Verify that a concurrency limit below 1 is rejected instead of skipping every item."""
+    with pytest.raises(ValueError, match="concurrency_limit"):
+        await run_tasks_concurrently([1, 2, 3], AsyncMock(), concurrency_limit=0)
+
+async def test_yield_batches_in_order_preserves_order():
+    """Verify that batches are yielded in input order even when later ones finish first."""
+    items = [1, 2, 3, 4, 5]
+
+    async def processor(batch, client):
+        # Earlier batches take longer to complete
+        await asyncio.sleep(0.01 * (5 - batch[0]))
+        return [item * 2 for item in batch]
+
+    batches = [
+        batch async for batch in yield_batches_in_order(
+            items, batch_size=2, processor_fn=processor, concurrency_limit=3, client=MagicMock()
+        )
+    ]
+    assert batches == [[2, 4], [6, 8], [10]]
+
+async def test_yield_batches_in_order_awaits_cancelled_tasks_on_early_exit():
+    """Verify that closing the stream early cancels and awaits the in-flight batches."""
+    pending = []
+
+    async def processor(batch, client):
+        if batch[0] > 1:
+            pending.append(asyncio.current_task())
+            await asyncio.sleep(10)
+        return batch
+
+    stream = yield_batches_in_order(
+        [1, 2, 3], batch_size=1, processor_fn=processor, concurrency_limit=3, client=MagicMock()
+    )
+    first = await anext(stream)
+    await stream.aclose()
+
+    assert first == [1]
+
+    # Finished cancelling, not merely asked to cancel
+    assert len(pending) == 2
+    assert all(task.cancelled() for task in pending)
+
+@pytest.mark.parametrize("stream_fn", [yield_batches_in_order, yield_batches_concurrently])
+async def test_batch_streams_reject_non_positive_limit(stream_fn):
+    """Verify that both batch streams validate the limit like run_tasks_concurrently."""
+    stream = stream_fn([1, 2], batch_size=1, processor_fn=AsyncMock(), concurrency_limit=0, client=MagicMock())
+    with pytest.raises(ValueError, match="concurrency_limit"):
+        await anext(stream)
@@ -1,9 +1,14 @@
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+from data_pipeline.utils import wikidata_helpers
 from data_pipeline.utils.wikidata_helpers import (
+    async_resolve_qids_to_labels,
+    clear_label_cache,
     extract_wikidata_label, 
-    extract_wikidata_aliases
+    extract_wikidata_aliases,
+    extract_wikidata_labels_bulk,
+    load_wikidata
 )
 
 def test_extract_wikidata_label_english_exists():
@@ -48,3 +53,79 @@ def test_extract_wikidata_aliases_fallback():
         }
     }
     assert extract_wikidata_aliases(data, lang="en", languages=["de"]) == ["German Alias"]
+
+def test_extract_wikidata_label_skips_empty_primary_with_tuple_languages():
+    # Case: primary entry is empty, fallback order comes from a tuple
+    data = {
+        "labels": {
+            "en": {},
+            "es": {"language": "es", "value": "Spanish Label"},
+            "de": {"language": "de", "value": "German Label"}
+        }
+    }
+    assert extract_wikidata_label(data, lang="en", languages=("en", "es", "de")) == "Spanish Label"
+    assert extract_wikidata_aliases({"aliases": {}}, lang="en", languages=("en", "de")) == []
+
+def test_extract_wikidata_labels_bulk_matches_single_extraction():
+    entities = [
+        {"labels": {"en": {"value": "English"}, "de": {"value": "Deutsch"}}},
+        {"labels": {"de": {"value": "Nur Deutsch"}}},
+        {"labels": {"xx": {"value": "Unknown"}}},
+        {},
+    ]
+    languages = ("en", "de")
+    expected = [extract_wikidata_label(e, lang="en", languages=languages) for e in entities]
+    assert extract_wikidata_labels_bulk(entities, lang="en", languages=languages) == expected
+    assert expected == ["English", "Nur Deutsch", None, None]
+
+@pytest.fixture
+def empty_label_cache():
+    clear_label_cache()
+    yield
+    clear_label_cache()
+
+def test_label_cache_evicts_least_recently_used(empty_label_cache, monkeypatch):
+    monkeypatch.setattr(wikidata_helpers, "_LABEL_CACHE_MAXSIZE", 2)
+    for qid in ("Q1", "Q2"):
+        wikidata_helpers._remember_label((qid, "en", ()), qid)
+    wikidata_helpers._recall_label(("Q1", "en", ()))  # Touch Q1 so Q2 is the oldest
+    wikidata_helpers._remember_label(("Q3", "en", ()), "Q3")
+
+    assert wikidata_helpers._recall_label(("Q1", "en", ())) == "Q1"
+    assert wikidata_helpers._recall_label(("Q2", "en", ())) is None
+
+async def test_async_resolve_qids_to_labels_fetches_only_unseen_qids(empty_label_cache):
+    fetch = MagicMock()
+
+    async def fake_fetch(context, qids, **kwargs):
+        fetch(qids)
+        return {qid: {"labels": {"en": {"value": f"Label {qid}"}}} for qid in qids}
+
+    with patch.object(wikidata_helpers, "async_fetch_wikidata_entities_batch", side_effect=fake_fetch):
+        first = await async_resolve_qids_to_labels(MagicMock(), ["Q30", "Q183"], api_url="", cache_dir=MagicMock())
+        second = await async_resolve_qids_to_labels(MagicMock(), ["Q30", "Q142"], api_url="", cache_dir=MagicMock())
+
+    assert first == {"Q30": "Label Q30", "Q183": "Label Q183"}
+    assert second == {"Q30": "Label Q30", "Q142": "Label Q142"}
+    assert [c.args[0] for c in fetch.call_args_list] == [["Q30", "Q183"], ["Q142"]]
+
+async def test_async_resolve_qids_to_labels_keys_cache_on_primary_language(empty_label_cache):
+    async def fake_fetch(context, qids, **kwargs):
+        return {qid: {"labels": {"en": {"value": "Germany"}, "de": {"value": "Deutschland"}}} for qid in qids}
+
+    with patch.object(wikidata_helpers, "async_fetch_wikidata_entities_batch", side_effect=fake_fetch):
+        english = await async_resolve_qids_to_labels(MagicMock(), ["Q183"], api_url="", cache_dir=MagicMock())
+        german = await async_resolve_qids_to_labels(
+            MagicMock(), ["Q183"], api_url="", cache_dir=MagicMock(), lang="de"
+        )
+
+    assert english == {"Q183": "Germany"}
+    assert german == {"Q183": "Deutschland"}
+
+@pytest.mark.parametrize("payload", [
+    b'{"entities": {"Q1": {"labels": {"en": {"value": "Universe"}}}}}',
+    '{"entities": {"Q1": {"labels": {"en": {"value": "Universe"}}}}}',
+])
+def test_load_wikidata_accepts_bytes_and_str(payload):
+    data = load_wikidata(payload)
+    assert extract_wikidata_label(data["entities"]["Q1"]) == "Universe"
@@ -7,13 +7,12 @@
 # email pacoreyes@protonmail.com
 # -----------------------------------------------------------
 
-import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 from pathlib import Path
 from data_pipeline.utils.wikipedia_helpers import async_fetch_wikipedia_article
 from data_pipeline.utils.network_helpers import HTTPError
+from data_pipeline.utils.io_helpers import migrate_flat_cache_to_shards
 
-@pytest.mark.asyncio
 async def test_async_fetch_wikipedia_article_cache_hit():
     context = MagicMock()
     title = "Test_Article"
@@ -31,7 +30,6 @@ async def test_async_fetch_wikipedia_article_cache_hit():
         assert result == cached_content
         mock_read.assert_called_once()
 
-@pytest.mark.asyncio
 async def test_async_fetch_wikipedia_article_cache_miss_fetch_success():
     context = MagicMock()
     title = "Test_Article"
@@ -65,7 +63,6 @@ async def test_async_fetch_wikipedia_article_cache_miss_fetch_success():
         args, _ = mock_write.call_args
         assert args[1] == fetched_content
 
-@pytest.mark.asyncio
 async def test_async_fetch_wikipedia_article_api_failure():
     context = MagicMock()
     title = "Test_Article"
@@ -79,3 +76,34 @@ async def test_async_fetch_wikipedia_article_api_failure():
         result = await async_fetch_wikipedia_article(context, title, qid=qid, api_url=api_url, cache_dir=cache_dir)
         
         assert result is None
+
+async def test_async_fetch_wikipedia_article_normalizes_title():
+    context = MagicMock()
+    api_url = "http://test.api"
+    cache_dir = Path("/tmp/cache")
+
+    with patch("data_pipeline.utils.wikipedia_helpers.async_read_text_file", return_value=None), \
+         patch("data_pipeline.utils.wikipedia_helpers.make_async_request_with_retries", new_callable=AsyncMock) as mock_request:
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"query": {"pages": {"-1": {}}}}
+        mock_request.return_value = mock_response
+
+        await async_fetch_wikipedia_article(context, "Caf%C3%A9_del_Mar", qid="Q1", api_url=api_url, cache_dir=cache_dir)
+        await async_fetch_wikipedia_article(context, "Depeche_Mode", qid="Q2", api_url=api_url, cache_dir=cache_dir)
+
+        titles = [dict(call.kwargs["params"])["titles"] for call in mock_request.call_args_list]
+        assert titles == ["Café del Mar", "Depeche Mode"]
+
+async def test_async_fetch_wikipedia_article_reads_migrated_cache(tmp_path):
+    """A file cached flat before sharding is served once the cache has been migrated."""
+    (tmp_path / "Q123.txt").write_text("Old cached content.", encoding="utf-8")
+    assert migrate_flat_cache_to_shards(tmp_path, ".txt") == 1
+
+    with patch("data_pipeline.utils.wikipedia_helpers.make_async_request_with_retries", new_callable=AsyncMock) as mock_request:
+        result = await async_fetch_wikipedia_article(
+            MagicMock(), "Test_Article", qid="Q123", api_url="http://test.api", cache_dir=tmp_path
+        )
+
+    assert result == "Old cached content."
+    mock_request.assert_not_called()